@@ -1,19 +1,168 @@
+import asyncio
+import json
+import os
 import pygame
+from collections import OrderedDict
 
 class AssetManager:
     """Utility class for loading and caching images."""
-    _image_cache = {}
+    _image_cache = {}  # (path, size) -> Surface
+    ATLAS_PATH = os.path.join("Game_assets", "atlas.png")
+    ATLAS_INDEX_PATH = os.path.join("Game_assets", "atlas.json")
+    _atlas = None
+    _atlas_index = None
+    # Every (path, size) the game requests, by group in the order they are needed on startup
+    ASSET_GROUPS = [
+        ("interface", [
+            ("Game_assets/Menu/Shop_background.gif", (200, 150)),
+            ("Game_assets/UI/Upgrade_button.gif", (50, 50)),
+            ("Game_assets/UI/Pause_button.gif", (60, 60)),
+            ("Game_assets/UI/Play_button.gif", (60, 60)),
+            ("Game_assets/Heart_icon.gif", (100, 100)),
+            ("Game_assets/Resource_icon.gif", (100, 100)),
+        ]),
+        ("towers", [
+            ("Game_assets/HelperCells/Helper_T_Cell.gif", (50, 50)),
+            ("Game_assets/Neutrophil/Neutrophil_Projectile_1.gif", None),
+        ] + [(f"Game_assets/Neutrophil/Neutrophil_{i}.gif", (50, 50)) for i in range(1, 7)]
+          + [(f"Game_assets/Macrophage/Macrophage_{i}.gif", (50, 50)) for i in range(1, 5)]),
+        ("enemies", [(f"Game_assets/Virus/Virus_{i}.gif", (30, 30)) for i in range(1, 5)]
+          + [(f"Game_assets/Bacteria/Bacteria_{i}.gif", (35, 35)) for i in range(1, 5)]
+          + [(f"Game_assets/Cancer/Cancer_{i}.gif", (40, 40)) for i in range(1, 3)]),
+    ]
+    # Packed into the atlas by Tools/bake_assets.py
+    MANIFEST = [entry for _, entries in ASSET_GROUPS for entry in entries]
+    _transform_cache = OrderedDict()
+    TRANSFORM_CACHE_SIZE = 512
+    ANGLE_STEP = 5  # Degrees between cached rotations
+    SCALE_STEP = 0.02  # Scale factor resolution of cached resizes
+    transform_hits = 0
+    transform_misses = 0
+    _font_cache = {}
+    _text_cache = OrderedDict()
+    TEXT_CACHE_SIZE = 256
 
     @staticmethod
     def load_image(path, size=None):
-        """Load an image from the cache or file system, optionally resizing it."""
-        if path not in AssetManager._image_cache:
-            try:
-                image = pygame.image.load(path).convert_alpha()
-                if size:
-                    image = pygame.transform.scale(image, size)
-                AssetManager._image_cache[path] = image
-            except pygame.error as e:
-                print(f"Error loading image {path}: {e}")
-                return None
-        return AssetManager._image_cache[path]
\ No newline at end of file
+        """Load an image at the given size from the cache, the baked atlas or the file system."""
+        key = (path, tuple(size) if size else None)
+        if key not in AssetManager._image_cache:
+            image = AssetManager._load_from_atlas(key)
+            if image is None:
+                image = AssetManager._load_from_disk(path, size)
+                if image is None:
+                    return None
+            AssetManager._image_cache[key] = image
+        return AssetManager._image_cache[key]
+
+    @staticmethod
+    async def preload(groups, on_progress=None, chunk_size=4):
+        """Load every (path, size) in a list of (name, entries) groups into the cache.
+
+        Control returns to the event loop after every chunk_size images so a browser build stays
+        responsive; on_progress is then called with (images loaded, total images, group name).
+        """
+        total = sum(len(entries) for _, entries in groups)
+        loaded = 0
+        for name, entries in groups:
+            for start in range(0, len(entries), chunk_size):
+                chunk = entries[start:start + chunk_size]
+                for path, size in chunk:
+                    AssetManager.load_image(path, size)
+                loaded += len(chunk)
+                if on_progress is not None:
+                    on_progress(loaded, total, name)
+                await asyncio.sleep(0)
+
+    @staticmethod
+    def _load_from_disk(path, size=None):
+        """Decode an image file and scale it to size, returning None if it can't be loaded."""
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error loading image {path}: {e}")
+            return None
+        # Pixel-format conversion needs a display; headless runs keep the decoded format
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+        return image
+
+    @staticmethod
+    def _load_from_atlas(key):
+        """Return the baked atlas region for a (path, size) key, reading the atlas on first use."""
+        if AssetManager._atlas_index is None:
+            AssetManager._atlas_index = {}
+            if os.path.exists(AssetManager.ATLAS_INDEX_PATH):
+                with open(AssetManager.ATLAS_INDEX_PATH) as f:
+                    for entry in json.load(f):
+                        size = tuple(entry["size"]) if entry["size"] else None
+                        AssetManager._atlas_index[(entry["path"], size)] = pygame.Rect(entry["rect"])
+        rect = AssetManager._atlas_index.get(key)
+        if rect is None:
+            return None
+        if AssetManager._atlas is None:
+            atlas = pygame.image.load(AssetManager.ATLAS_PATH)
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()
+            AssetManager._atlas = atlas
+        return AssetManager._atlas.subsurface(rect)
+
+    @staticmethod
+    def get_transformed(image, angle=0, flip=False, scale=1.0):
+        """Return image flipped, scaled and rotated, reusing a cached Surface for the quantized transform."""
+        angle_bucket = round(angle / AssetManager.ANGLE_STEP) % round(360 / AssetManager.ANGLE_STEP)
+        scale_bucket = round(scale / AssetManager.SCALE_STEP)
+        key = (image, angle_bucket, flip, scale_bucket)
+        cache = AssetManager._transform_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            AssetManager.transform_hits += 1
+            return cached
+        AssetManager.transform_misses += 1
+        result = image
+        if flip:
+            result = pygame.transform.flip(result, True, False)
+        if scale_bucket != round(1 / AssetManager.SCALE_STEP):
+            factor = scale_bucket * AssetManager.SCALE_STEP
+            result = pygame.transform.scale(result, (int(image.get_width() * factor), int(image.get_height() * factor)))
+        if angle_bucket:
+            result = pygame.transform.rotate(result, angle_bucket * AssetManager.ANGLE_STEP)
+        cache[key] = result
+        if len(cache) > AssetManager.TRANSFORM_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def transform_stats():
+        """Return hit/miss counters and current size of the transform cache."""
+        return {
+            "hits": AssetManager.transform_hits,
+            "misses": AssetManager.transform_misses,
+            "size": len(AssetManager._transform_cache),
+        }
+
+    @staticmethod
+    def get_font(path=None, size=24):
+        """Load a font once per (path, size); path None selects pygame's default font."""
+        key = (path, size)
+        if key not in AssetManager._font_cache:
+            AssetManager._font_cache[key] = pygame.font.Font(path, size)
+        return AssetManager._font_cache[key]
+
+    @staticmethod
+    def render_text(font, text, color=(255, 255, 255)):
+        """Render text with antialiasing, reusing the Surface while the text and colour are unchanged."""
+        key = (font, text, color)
+        cache = AssetManager._text_cache
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        surface = font.render(text, True, color)
+        cache[key] = surface
+        if len(cache) > AssetManager.TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return surface
\ No newline at end of file
@@ -2,9 +2,21 @@ import pygame
 import math
 import os
 from AssetManager import AssetManager
+from Rendering.Layer import Layer
 
 class Cell:
     """Base class for towers with attack, range, and upgrade logic."""
+    # Which enemy in range to attack: nearest its exit, furthest from it, most health, or nearest the tower
+    TARGETING_POLICIES = ("first", "last", "strongest", "closest")
+    # Sprites and the menu are shared by every tower of a class, set up by the first one built
+    tower_imgs = ()
+    menu = None
+    offset = -110
+    __slots__ = ("x", "y", "level", "base_damage", "base_range_radius", "base_cooldown", "damage",
+                 "range_radius", "cooldown", "is_boosted", "boosts", "should_rotate", "last_attack_time",
+                 "targeting", "target_id", "target_pos", "inRange", "selected", "projectile_system",
+                 "clock", "range_layer")
+
     def __init__(self, x, y, damage, range_radius, cooldown, should_rotate=True):
         self.x = x
         self.y = y
@@ -16,33 +28,65 @@ class Cell:
         self.range_radius = range_radius
         self.cooldown = cooldown
         self.is_boosted = False
+        self.boosts = (0, 0, 0)  # Damage, range and attack speed boosts from Helper T-Cells
         self.should_rotate = should_rotate
-        self.tower_imgs = []
         self.last_attack_time = 0
-        self.target_enemy = None
+        self.targeting = "first"
+        self.target_id = None
+        self.target_pos = None
         self.inRange = False
         self.selected = False
-        self.menu = None
-        self.offset = -110
+        self.projectile_system = None
+        self.clock = None  # The game's simulation clock, set when the tower is placed
+        self.range_layer = Layer(self._render_range_circle)
+
+    def ready_time(self):
+        """Return the simulation time the attack cooldown expires."""
+        return self.last_attack_time + self.cooldown
 
     def can_attack(self):
         """Check if the tower can attack based on cooldown."""
-        return pygame.time.get_ticks() - self.last_attack_time >= self.cooldown
+        return self.clock.get_ticks() >= self.ready_time()
+
+    def choose_target(self, targets):
+        """Pick the enemy to attack from those in range, which arrive nearest-to-exit first."""
+        if self.targeting == "last":
+            return targets[-1]
+        if self.targeting == "strongest":
+            return max(targets, key=lambda enemy: enemy.health)
+        if self.targeting == "closest":
+            return min(targets, key=lambda enemy: math.hypot(enemy.x - self.x, enemy.y - self.y))
+        return targets[0]
+
+    def cycle_targeting(self):
+        """Switch to the next targeting policy."""
+        policies = self.TARGETING_POLICIES
+        self.targeting = policies[(policies.index(self.targeting) + 1) % len(policies)]
 
     def attack(self, enemies):
-        """Attack the first enemy in range if possible."""
+        """Attack the enemy in range chosen by the targeting policy if possible."""
         if not self.can_attack():
             return
-        for enemy in enemies:
-            if math.hypot(self.x - enemy.x, self.y - enemy.y) <= self.range_radius:
-                enemy.hit(self.damage)
-                self.target_enemy = enemy
-                self.inRange = True
-                self.last_attack_time = pygame.time.get_ticks()
-                break
+        targets = enemies.query(self.x, self.y, self.range_radius)
+        if targets:
+            enemy = self.choose_target(targets)
+            enemy.hit(self.damage)
+            self.target_id = enemy.id
+            self.target_pos = (enemy.x, enemy.y)
+            self.inRange = True
+            self.last_attack_time = self.clock.get_ticks()
         else:
             self.inRange = False
-            self.target_enemy = None
+            self.target_id = None
+            self.target_pos = None
+
+    def track_target(self, enemies):
+        """Follow the current target's position for rotation, keeping its last position once it is gone."""
+        if self.target_id is None:
+            return
+        enemy = enemies.get(self.target_id)
+        if enemy is not None:
+            self.target_pos = (enemy.x, enemy.y)
 
     def update(self, enemies, is_paused):
         """Placeholder for per-frame updates, such as animations or AOE attacks."""
@@ -50,26 +94,34 @@ class Cell:
 
     def _rotate_image(self, image):
         """Rotate the tower image to face the target enemy."""
-        if not self.inRange or not self.target_enemy:
+        if not self.inRange or self.target_pos is None:
             return image
-        dx, dy = self.target_enemy.x - self.x, self.target_enemy.y - self.y
+        dx, dy = self.target_pos[0] - self.x, self.target_pos[1] - self.y
         angle = math.degrees(math.atan2(dy, dx)) + (getattr(self, 'image_offset_angle', 0))
-        return pygame.transform.rotate(image, -angle)
+        return AssetManager.get_transformed(image, angle=-angle)
+
+    @staticmethod
+    def _render_range_circle(radius):
+        """Render a translucent range circle of the given radius."""
+        circle_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(circle_surface, (180, 180, 180, 100), (radius, radius), radius)
+        return circle_surface
 
     def draw_range_circle(self, screen):
-        """Draw the tower's range circle on the screen."""
-        circle_surface = pygame.Surface((self.range_radius * 2, self.range_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(circle_surface, (180, 180, 180, 100), (self.range_radius, self.range_radius), self.range_radius)
-        screen.blit(circle_surface, (self.x - self.range_radius, self.y - self.range_radius))
+        """Draw the tower's range circle on the screen, re-rendering it only when the range changes."""
+        circle_surface = self.range_layer.get(self.range_radius)
+        return screen.blit(circle_surface, (self.x - self.range_radius, self.y - self.range_radius))
 
     def draw_info_overlay(self, screen):
         """Draw the tower's info overlay when selected."""
-        font = pygame.font.Font(None, 24)
+        font = AssetManager.get_font(None, 24)
         attack_speed = self.cooldown / 1000
         info = [f"Level: {self.level}", f"Damage: {self.damage}", f"Range: {self.range_radius}", f"Attack Speed: {attack_speed}"]
+        rects = []
         for i, text in enumerate(info):
-            surface = font.render(text, True, (255, 255, 255))
-            screen.blit(surface, (self.x - 50, self.y + i * 20 - 10 + self.offset))
+            surface = AssetManager.render_text(font, text)
+            rects.append(screen.blit(surface, (self.x - 50, self.y + i * 20 - 10 + self.offset)))
+        return rects[0].unionall(rects[1:])
 
     def upgrade(self):
         """Upgrade the tower's level, increasing damage and range."""
@@ -77,9 +129,20 @@ class Cell:
             self.level += 1
             self.base_damage += 1
             self.base_range_radius += 20
-            if not self.is_boosted:
-                self.damage = self.base_damage
-                self.range_radius = self.base_range_radius
+            self.apply_boosts(*self.boosts)
+
+    def apply_boosts(self, damage_boost, range_boost, attack_speed_boost):
+        """Set effective stats from base stats and the combined Helper T-Cell boosts."""
+        self.boosts = (damage_boost, range_boost, attack_speed_boost)
+        self.is_boosted = any(self.boosts)
+        if not self.is_boosted:
+            self.damage = self.base_damage
+            self.range_radius = self.base_range_radius
+            self.cooldown = self.base_cooldown
+            return
+        self.damage = round(self.base_damage * (1 + damage_boost), 1)
+        self.range_radius = round(self.base_range_radius * (1 + range_boost))
+        self.cooldown = round(self.base_cooldown * (1 - attack_speed_boost))
 
     def get_upgrade_cost(self):
         """Get the cost for the next upgrade."""
@@ -88,13 +151,14 @@ class Cell:
         return self.menu.item_cost[min(self.level - 1, len(self.menu.item_cost) - 1)]
 
     def draw(self, screen):
-        """Draw the tower on the screen."""
+        """Draw the tower on the screen and return the area it covered."""
         if not self.tower_imgs:
-            pygame.draw.rect(screen, (0, 0, 255), (self.x - 25, self.y - 25, 50, 50))
+            rect = pygame.draw.rect(screen, (0, 0, 255), (self.x - 25, self.y - 25, 50, 50))
         else:
             img = self.tower_imgs[0]
             if self.should_rotate:
                 img = self._rotate_image(img)
-            screen.blit(img, (self.x - img.get_width() // 2, self.y - img.get_height() // 2))
+            rect = screen.blit(img, (self.x - img.get_width() // 2, self.y - img.get_height() // 2))
         if self.selected:
-            self.draw_range_circle(screen)
\ No newline at end of file
+            rect = rect.union(self.draw_range_circle(screen))
+        return rect
\ No newline at end of file
@@ -1,13 +1,9 @@
 from Enemies.Enemy import Enemy
-from AssetManager import AssetManager
+from Enemies.EnemyType import EnemyType
 
 class Bacteria(Enemy):
+    __slots__ = ()
+    TYPE = EnemyType("Bacteria", "Game_assets/Bacteria/Bacteria_{}.gif", frame_count=4, size=35, max_health=10, velocity=1, money=15)
+
     def __init__(self, path_index=0):
-        super().__init__(0, 0, 35, 35, path_index)
-        self.images = [
-            AssetManager.load_image(f"Game_assets/Bacteria/Bacteria_{i}.gif", (self.width, self.height)) for i in range(1, 5)
-        ]
-        self.health = 10
-        self.max_health = 10
-        self.velocity = 1
-        self.money = 15
\ No newline at end of file
+        super().__init__(self.TYPE, path_index)
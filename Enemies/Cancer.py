@@ -1,13 +1,9 @@
 from Enemies.Enemy import Enemy
-from AssetManager import AssetManager
+from Enemies.EnemyType import EnemyType
 
 class Cancer(Enemy):
+    __slots__ = ()
+    TYPE = EnemyType("Cancer", "Game_assets/Cancer/Cancer_{}.gif", frame_count=2, size=40, max_health=20, velocity=0.5, money=25)
+
     def __init__(self, path_index=0):
-        super().__init__(0, 0, 40, 40, path_index)
-        self.images = [
-            AssetManager.load_image(f"Game_assets/Cancer/Cancer_{i}.gif", (self.width, self.height)) for i in range(1, 3)
-        ]
-        self.health = 20
-        self.max_health = 20
-        self.velocity = 0.5
-        self.money = 25
\ No newline at end of file
+        super().__init__(self.TYPE, path_index)
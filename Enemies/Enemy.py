@@ -1,5 +1,6 @@
 import pygame
-import math
+from Enemies.PathTable import PathTable
+from AssetManager import AssetManager
 
 class Enemy:
     """Base class for enemies with path movement and drawing logic."""
@@ -8,59 +9,106 @@ class Enemy:
         [(40, 5), (53, 17), (55, 35), (49, 53), (44, 64), (43, 80), (48, 97), (65, 105), (83, 109), (101, 113), (117, 118), (130, 129), (130, 143), (124, 156), (117, 167), (112, 181), (112, 196), (121, 210), (138, 216), (155, 218), (171, 216), (188, 212), (205, 215), (222, 220), (244, 227), (263, 238), (274, 254), (287, 267), (326, 295), (368, 318), (428, 324), (479, 318), (530, 321), (572, 342), (608, 374), (637, 399), (671, 422), (713, 434), (765, 441), (808, 445), (870, 446), (934, 444), (984, 441), (1010, 471), (1038, 497), (1069, 511), (1109, 528), (1156, 546), (1276, 581)],
         [(5, 403), (33, 402), (67, 409), (109, 415), (147, 414), (182, 403), (218, 383), (252, 358), (288, 316), (342, 314), (405, 323), (459, 322), (504, 316), (542, 327), (594, 356), (654, 414), (722, 435), (806, 445), (903, 439), (957, 400), (1008, 387), (1058, 376), (1103, 350), (1141, 299), (1152, 239), (1152, 180), (1152, 130), (1167, 83), (1187, 44), (1219, 15), (1246, 3)]
     ]
+    # Compiled once so enemies only track a scalar distance along their path
+    PATH_TABLES = [PathTable(path) for path in PATHS]
 
-    def __init__(self, x, y, width, height, path_index=0):
-        self.width = width
-        self.height = height
-        self.images = []
+    # Only per-enemy state lives on the instance; everything shared by a kind is on its EnemyType
+    __slots__ = ("id", "enemy_type", "health", "velocity", "animation_count", "path_index", "path",
+                 "path_table", "path_pos", "distance", "x", "y", "prev_x", "prev_y", "flipped",
+                 "last_dir_x", "is_finished")
+
+    def __init__(self, enemy_type, path_index=0):
+        self.id = None  # Assigned by the entity registry when the enemy spawns
+        self.set_type(enemy_type)
         self.animation_count = 0
-        self.animation_speed = 0.1
-        self.health = 1
-        self.max_health = 2
-        self.velocity = 1
+        self._start_path(path_index)
+
+    def set_type(self, enemy_type):
+        """Switch to another type descriptor, resetting health and speed to its stats."""
+        self.enemy_type = enemy_type
+        self.health = enemy_type.max_health
+        self.velocity = enemy_type.velocity
+
+    images = property(lambda self: self.enemy_type.images)
+    width = property(lambda self: self.enemy_type.width)
+    height = property(lambda self: self.enemy_type.height)
+    max_health = property(lambda self: self.enemy_type.max_health)
+    money = property(lambda self: self.enemy_type.money)
+    animation_speed = property(lambda self: self.enemy_type.animation_speed)
+
+    def _start_path(self, path_index):
+        """Put the enemy at the start of a path."""
+        self.path_index = path_index
         self.path = self.PATHS[path_index]
+        self.path_table = self.PATH_TABLES[path_index]
         self.path_pos = 0
+        self.distance = 0.0
         self.x = self.path[0][0]
         self.y = self.path[0][1]
+        # Position before the last step, for interpolating between steps when drawing
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.flipped = False
         self.last_dir_x = 0
         self.is_finished = False
-        self.money = 5
+
+    def reset(self, path_index=0):
+        """Return a used enemy to the start of a path at full health, ready to spawn again."""
+        self.id = None
+        self.health = self.enemy_type.max_health
+        self.velocity = self.enemy_type.velocity
+        self.animation_count = 0
+        self._start_path(path_index)
 
     def move(self):
-        """Move the enemy along its path."""
-        if self.path_pos + 1 >= len(self.path):
+        """Advance the enemy along its path by its velocity."""
+        table = self.path_table
+        self.prev_x, self.prev_y = self.x, self.y
+        self.distance += self.velocity
+        if self.distance >= table.total_length:
+            self.distance = table.total_length
+            self.x, self.y = self.path[-1]
             self.is_finished = True
             return
-        next_x, next_y = self.path[self.path_pos + 1]
-        dx, dy = next_x - self.x, next_y - self.y
-        distance = math.hypot(dx, dy)
-        if distance < self.velocity:
-            self.path_pos += 1
-        else:
-            # Move towards the next point
-            self.x += (dx / distance) * self.velocity
-            self.y += (dy / distance) * self.velocity
-            self.last_dir_x = dx
-            self.flipped = dx < 0
-        self.animation_count += self.animation_speed
-        if self.animation_count >= len(self.images):
+        self.path_pos = table.segment_at(self.distance, self.path_pos)
+        self.x, self.y = table.position(self.distance, self.path_pos)
+        self.last_dir_x = table.directions[self.path_pos][0]
+        self.flipped = self.last_dir_x < 0
+        enemy_type = self.enemy_type
+        self.animation_count += enemy_type.animation_speed
+        if self.animation_count >= enemy_type.frame_count:
             self.animation_count = 0
 
+    def set_distance(self, distance):
+        """Place the enemy at an arbitrary distance along its path."""
+        self.distance = min(max(distance, 0.0), self.path_table.total_length)
+        self.path_pos = self.path_table.locate(self.distance)
+        self.x, self.y = self.path_table.position(self.distance, self.path_pos)
+        self.prev_x, self.prev_y = self.x, self.y
+
     def hit(self, damage):
         """Reduce enemy health by the given damage."""
         self.health -= damage
 
-    def draw(self, screen):
-        """Draw the enemy and its health bar on the screen."""
-        if not self.images:
-            pygame.draw.rect(screen, (255, 0, 0), (self.x - self.width // 2, self.y - self.height // 2, self.width, self.height))
-        else:
-            img = self.images[int(self.animation_count)]
-            if self.flipped:
-                img = pygame.transform.flip(img, True, False)
-            screen.blit(img, (self.x - self.width // 2, self.y - self.height // 2))
-            # Draw health bar
-            health_bar_width = self.width * (self.health / self.max_health)
-            pygame.draw.rect(screen, (255, 0, 0), (self.x - self.width // 2, self.y - self.height - 10, self.width, 5))
-            pygame.draw.rect(screen, (0, 255, 0), (self.x - self.width // 2, self.y - self.height - 10, health_bar_width, 5))
\ No newline at end of file
+    def draw(self, screen, alpha=1.0):
+        """Draw the enemy and its health bar on the screen and return the area they covered.
+
+        alpha is how far the frame falls between the previous simulation step and the current one.
+        """
+        x = self.prev_x + (self.x - self.prev_x) * alpha
+        y = self.prev_y + (self.y - self.prev_y) * alpha
+        return Enemy.draw_at(screen, self.enemy_type, x, y, int(self.animation_count), self.flipped, self.health)
+
+    @staticmethod
+    def draw_at(screen, enemy_type, x, y, frame, flipped, health):
+        """Draw an enemy of enemy_type and its health bar at (x, y) and return the area they covered."""
+        width, height = enemy_type.width, enemy_type.height
+        img = enemy_type.images[frame]
+        if flipped:
+            img = AssetManager.get_transformed(img, flip=True)
+        rect = screen.blit(img, (x - width // 2, y - height // 2))
+        # Draw health bar
+        health_bar_width = width * (health / enemy_type.max_health)
+        bar = pygame.draw.rect(screen, (255, 0, 0), (x - width // 2, y - height - 10, width, 5))
+        pygame.draw.rect(screen, (0, 255, 0), (x - width // 2, y - height - 10, health_bar_width, 5))
+        return rect.union(bar)
\ No newline at end of file
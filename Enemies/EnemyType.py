@@ -0,0 +1,38 @@
+from AssetManager import AssetManager
+
+class EnemyType:
+    """Flyweight holding the data shared by every enemy of one kind: sprites, size and base stats."""
+    __slots__ = ("name", "image_pattern", "frame_count", "width", "height", "max_health", "velocity",
+                 "money", "animation_speed", "_images")
+
+    def __init__(self, name, image_pattern, frame_count, size, max_health, velocity, money, animation_speed=0.1):
+        self.name = name
+        self.image_pattern = image_pattern  # Sprite path with {} for the 1-based frame number
+        self.frame_count = frame_count
+        self.width = self.height = size
+        self.max_health = max_health
+        self.velocity = velocity
+        self.money = money
+        self.animation_speed = animation_speed
+        self._images = None
+
+    @property
+    def images(self):
+        """Animation frames, loaded on first use so a display can be set up first."""
+        if self._images is None:
+            self._images = [
+                AssetManager.load_image(self.image_pattern.format(i), (self.width, self.height))
+                for i in range(1, self.frame_count + 1)
+            ]
+        return self._images
+
+    def with_overrides(self, **stats):
+        """Return a copy of this type with some stats replaced, e.g. for balance tuning."""
+        copy = EnemyType(self.name, self.image_pattern, self.frame_count, self.width, self.max_health,
+                         self.velocity, self.money, self.animation_speed)
+        copy._images = self._images
+        for name, value in stats.items():
+            if name not in ("max_health", "velocity", "money", "animation_speed"):
+                raise ValueError(f"{name} is not an adjustable enemy stat")
+            setattr(copy, name, value)
+        return copy
@@ -0,0 +1,33 @@
+import bisect
+import math
+
+class PathTable:
+    """Arc-length table for one enemy path, mapping distance travelled to a position on the path."""
+    def __init__(self, points):
+        self.points = points
+        self.lengths = [0.0]  # Cumulative arc length at the start of each waypoint
+        self.directions = []  # Unit direction of each segment
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            length = math.hypot(x1 - x0, y1 - y0)
+            self.directions.append(((x1 - x0) / length, (y1 - y0) / length) if length else (0.0, 0.0))
+            self.lengths.append(self.lengths[-1] + length)
+        self.total_length = self.lengths[-1]
+
+    def segment_at(self, distance, hint=0):
+        """Return the segment containing distance, walking forward from a previous segment index."""
+        lengths = self.lengths
+        last = len(self.directions) - 1
+        while hint < last and distance >= lengths[hint + 1]:
+            hint += 1
+        return hint
+
+    def locate(self, distance):
+        """Return the segment containing distance using a binary search over the table."""
+        return min(max(bisect.bisect_right(self.lengths, distance) - 1, 0), len(self.directions) - 1)
+
+    def position(self, distance, segment):
+        """Return the (x, y) point at distance along the path, given the segment that contains it."""
+        start_x, start_y = self.points[segment]
+        dir_x, dir_y = self.directions[segment]
+        offset = distance - self.lengths[segment]
+        return start_x + dir_x * offset, start_y + dir_y * offset
@@ -1,13 +1,9 @@
 from Enemies.Enemy import Enemy
-from AssetManager import AssetManager
+from Enemies.EnemyType import EnemyType
 
 class Virus(Enemy):
+    __slots__ = ()
+    TYPE = EnemyType("Virus", "Game_assets/Virus/Virus_{}.gif", frame_count=4, size=30, max_health=5, velocity=2, money=10)
+
     def __init__(self, path_index=0):
-        super().__init__(0, 0, 30, 30, path_index)
-        self.images = [
-            AssetManager.load_image(f"Game_assets/Virus/Virus_{i}.gif", (self.width, self.height)) for i in range(1, 5)
-        ]
-        self.health = 5
-        self.max_health = 5
-        self.velocity = 2
-        self.money = 10
\ No newline at end of file
+        super().__init__(self.TYPE, path_index)
@@ -0,0 +1,76 @@
+"""Data-driven wave composition and the compact spawn schedules built from it."""
+from array import array
+
+from Enemies.Virus import Virus
+from Enemies.Bacteria import Bacteria
+from Enemies.Cancer import Cancer
+
+# A type code is an index into this tuple; schedules and snapshots store codes, not classes
+ENEMY_TYPES = (Virus, Bacteria, Cancer)
+PATH_COUNT = 3
+
+BASE_COUNT = 10
+COUNT_PER_WAVE = 5
+SPAWN_DELAY_BASE = 1000
+SPAWN_DELAY_STEP = 100
+MIN_SPAWN_DELAY = 200
+# (last wave of the tier or None for every later wave, (virus, bacteria, cancer) probabilities)
+WAVE_TIERS = (
+    (3, (0.9, 0.1, 0.0)),
+    (6, (0.7, 0.25, 0.05)),
+    (None, (0.5, 0.3, 0.2)),
+)
+
+def wave_size(wave):
+    """Number of enemies in a wave."""
+    return BASE_COUNT + COUNT_PER_WAVE * (wave - 1)
+
+def spawn_delay(wave):
+    """Milliseconds between spawns in a wave, shrinking as waves progress."""
+    return max(MIN_SPAWN_DELAY, SPAWN_DELAY_BASE - SPAWN_DELAY_STEP * (wave - 1))
+
+def tier_probabilities(wave, tiers=WAVE_TIERS):
+    """Return the (virus, bacteria, cancer) probabilities of the tier a wave falls in."""
+    for last_wave, probabilities in tiers:
+        if last_wave is None or wave <= last_wave:
+            return probabilities
+    return tiers[-1][1]
+
+def build_wave(wave, rng, tiers=WAVE_TIERS):
+    """Roll the type and path of every enemy in a wave into a spawn schedule."""
+    virus_prob, bacteria_prob, _ = tier_probabilities(wave, tiers)
+    bacteria_limit = virus_prob + bacteria_prob
+    types = array("B")
+    paths = array("B")
+    random, randint = rng.random, rng.randint
+    for _ in range(wave_size(wave)):
+        rand = random()
+        paths.append(randint(0, PATH_COUNT - 1))
+        types.append(0 if rand < virus_prob else 1 if rand < bacteria_limit else 2)
+    return WaveSchedule(types, paths)
+
+class WaveSchedule:
+    """The enemies still to spawn in a wave, as parallel byte arrays of type code and path.
+
+    Enemies are only built when popped, so a pending wave costs two bytes per enemy.
+    """
+    def __init__(self, types=(), paths=()):
+        self.types = array("B", types)
+        self.paths = array("B", paths)
+        self.position = 0
+
+    def pop(self):
+        """Return the (type code, path) of the next enemy to spawn."""
+        i = self.position
+        self.position += 1
+        return self.types[i], self.paths[i]
+
+    def clear(self):
+        self.position = len(self.types)
+
+    def __iter__(self):
+        """Iterate the (type code, path) of the enemies still to spawn."""
+        return zip(self.types[self.position:], self.paths[self.position:])
+
+    def __len__(self):
+        return len(self.types) - self.position
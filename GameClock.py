@@ -0,0 +1,18 @@
+class GameClock:
+    """Simulation time source owned by one game, advanced by a fixed step per simulation update."""
+    __slots__ = ("_time",)
+
+    def __init__(self, start_time=0):
+        self._time = start_time
+
+    def get_ticks(self):
+        """Return the current simulation time in milliseconds."""
+        return self._time
+
+    def reset(self, start_time=0):
+        """Restart the simulation clock, e.g. when a snapshot is loaded."""
+        self._time = start_time
+
+    def advance(self, ms):
+        """Advance the simulation clock by the given number of milliseconds."""
+        self._time += ms
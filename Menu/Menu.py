@@ -1,46 +1,55 @@
 import pygame
+from AssetManager import AssetManager
 
 class Menu:
-    """Menu class for handling tower upgrades and interactions."""
-    def __init__(self, tower, bg, item_cost):
-        self.tower = tower
+    """Menu class for handling tower upgrades and interactions.
+
+    One menu is shared by every tower of a class, so the tower it applies to is passed in.
+    """
+    def __init__(self, bg, item_cost):
         self.bg = bg
         self.item_cost = item_cost
-        self.buttons = []  # List of (img, name) tuples
+        self.buttons = []  # List of (img, name, label) tuples
         self.width = self.bg.get_width()
         self.height = self.bg.get_height()
         self.offset = -100  # Menu appears above the tower
-        self.visible = False  # Control menu visibility
 
-    def add_button(self, img, name):
-        """Add a button to the menu with an image and name."""
-        self.buttons.append((img, name))
+    def add_button(self, img, name, label=None):
+        """Add a button to the menu with an image and name.
+
+        label maps the tower to the button's text; by default it shows the name and upgrade cost.
+        Without an image the button is drawn as a plain square.
+        """
+        self.buttons.append((img, name, label))
 
-    def get_clicked(self, mx, my):
-        """Check if a button was clicked based on mouse position."""
-        if not self.visible:
-            return None
+    def get_clicked(self, tower, mx, my):
+        """Check if a button of the tower's menu was clicked based on mouse position."""
         # Calculate button positions dynamically based on tower's current position
-        x, y = self.tower.x, self.tower.y + self.offset
-        for i, (_, name) in enumerate(self.buttons):
+        x, y = tower.x, tower.y + self.offset
+        for i, (_, name, _) in enumerate(self.buttons):
             bx = x - self.width // 2 + 10
             by = y - self.height // 2 + i * 60 + 20
             if bx <= mx < bx + 50 and by <= my < by + 50:
                 return name
         return None
 
-    def draw(self, screen):
-        """Draw the menu on the screen if visible."""
-        if not self.visible:
-            return
+    def draw(self, screen, tower):
+        """Draw the menu above the tower and return the area it covered."""
         # Update menu position based on tower's current position
-        x, y = self.tower.x, self.tower.y + self.offset
-        screen.blit(self.bg, (x - self.width // 2, y - self.height // 2))
-        font = pygame.font.Font(None, 24)
-        for i, (img, name) in enumerate(self.buttons):
+        x, y = tower.x, tower.y + self.offset
+        rect = screen.blit(self.bg, (x - self.width // 2, y - self.height // 2))
+        font = AssetManager.get_font(None, 24)
+        for i, (img, name, label) in enumerate(self.buttons):
             bx = x - self.width // 2 + 10
             by = y - self.height // 2 + i * 60 + 20
-            screen.blit(img, (bx, by))
-            cost = self.item_cost[min(self.tower.level - 1, len(self.item_cost) - 1)]
-            text = font.render(f"{name}: {cost}", True, (255, 255, 255))
-            screen.blit(text, (bx + 45, by + 2))
\ No newline at end of file
+            if img is None:
+                rect.union_ip(pygame.draw.rect(screen, (200, 200, 200), (bx + 5, by + 5, 40, 40), border_radius=8))
+            else:
+                rect.union_ip(screen.blit(img, (bx, by)))
+            if label is None:
+                cost = self.item_cost[min(tower.level - 1, len(self.item_cost) - 1)]
+                text = AssetManager.render_text(font, f"{name}: {cost}")
+            else:
+                text = AssetManager.render_text(font, label(tower))
+            rect.union_ip(screen.blit(text, (bx + 45, by + 2)))
+        return rect
\ No newline at end of file
@@ -1,4 +1,6 @@
 import pygame
+from AssetManager import AssetManager
+from Rendering.Layer import Layer
 
 class Shop:
     def __init__(self, x, y, towers):
@@ -7,35 +9,41 @@ class Shop:
         self.towers = towers  # List of (tower_class, img, cost, menu_bg, upgrade_button) tuples
         self.width = len(towers) * 60 + 40
         self.height = 110
+        self.layer = Layer(self._render)
 
-    def get_clicked_tower(self, mx, my):
-        """Return the tower class and cost if clicked within the shop area."""
-        for i, (tower_class, _, cost, _, _) in enumerate(self.towers):
+    def get_clicked_index(self, mx, my):
+        """Return the index of the shop item clicked, or None if no item was clicked."""
+        for i in range(len(self.towers)):
             tower_x = self.x - (len(self.towers) * 60) // 2 + i * 60
             tower_y = self.y - 35  # Moved up 10 pixels for better centering
             if tower_x <= mx < tower_x + 50 and tower_y <= my < tower_y + 50:
-                return tower_class, cost
-        return None, 0
+                return i
+        return None
 
-    def draw(self, screen, font):
-        """Draw the shop UI with tower images and text shifted upward."""
-        # Draw the shop background with semi-transparent gray and rounded corners
-        background_rect = pygame.Rect(self.x - self.width // 2, self.y - self.height // 2, self.width, self.height)
-        pygame.draw.rect(screen, (80, 80, 80, 180), background_rect, border_radius=10)
+    def _render(self, font):
+        """Composite the shop panel, tower images and prices into one Surface."""
+        surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Draw the shop background in gray with rounded corners
+        pygame.draw.rect(surface, (80, 80, 80), surface.get_rect(), border_radius=10)
 
         # Calculate start_x to center the tower images horizontally
-        start_x = self.x - (len(self.towers) * 60) // 2
+        start_x = self.width // 2 - (len(self.towers) * 60) // 2
 
         for i, (_, img, cost, _, _) in enumerate(self.towers):
             tower_x = start_x + i * 60
-            tower_y = self.y - 35  # Moved up 10 pixels from self.y - 25
-            screen.blit(img, (tower_x, tower_y))
+            tower_y = self.height // 2 - 35  # Moved up 10 pixels from the vertical center - 25
+            surface.blit(img, (tower_x, tower_y))
 
             # Render the cost text with the provided font
-            cost_text = font.render(str(cost), True, (255, 255, 255))
+            cost_text = AssetManager.render_text(font, str(cost))
             text_width = cost_text.get_width()
 
             # Center the text below the tower image with a 10-pixel gap
             text_x = tower_x + 25 - text_width // 2  # 25 is half of image width (50/2)
             text_y = tower_y + 60  # Adjusted to maintain a 10-pixel gap
-            screen.blit(cost_text, (text_x, text_y))
\ No newline at end of file
+            surface.blit(cost_text, (text_x, text_y))
+        return surface
+
+    def draw(self, screen, font):
+        """Draw the cached shop panel and return the area it covered."""
+        return screen.blit(self.layer.get(font), (self.x - self.width // 2, self.y - self.height // 2))
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pygame
+
+class DirtyRectRenderer:
+    """Restores and pushes only the screen regions drawn in the previous and current frames."""
+    def __init__(self, screen, background, full_update_ratio=0.6):
+        self.screen = screen
+        self.background = background
+        self.full_update_area = screen.get_width() * screen.get_height() * full_update_ratio
+        self.previous = []
+        self.current = []
+        self.full_redraw = True
+
+    def invalidate(self):
+        """Force the next frame to redraw and push the whole screen."""
+        self.full_redraw = True
+
+    def begin(self):
+        """Restore the background under everything drawn last frame."""
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous:
+                self.screen.blit(self.background, rect, rect)
+        self.current = []
+
+    def add(self, rect):
+        """Record an area drawn this frame."""
+        if rect:
+            self.current.append(rect)
+
+    def end(self):
+        """Push the merged areas drawn this frame and last frame to the display."""
+        if self.full_redraw:
+            pygame.display.update()
+            self.full_redraw = False
+        else:
+            dirty = merge_rects(self.previous + self.current)
+            if sum(rect.width * rect.height for rect in dirty) > self.full_update_area:
+                pygame.display.update()
+            else:
+                pygame.display.update(dirty)
+        self.previous = merge_rects(self.current)
+
+def merge_rects(rects):
+    """Union overlapping rectangles so each screen region is restored and pushed only once."""
+    merged = []
+    for rect in rects:
+        if not rect:
+            continue
+        rect = rect.copy()
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
@@ -0,0 +1,13 @@
+class Layer:
+    """A pre-composited Surface that is re-rendered only when its inputs change."""
+    def __init__(self, render):
+        self.render = render  # Called with the layer's inputs, returns the composited Surface
+        self.inputs = None
+        self.surface = None
+
+    def get(self, *inputs):
+        """Return the cached Surface, re-rendering it if the inputs differ from the last call."""
+        if self.surface is None or inputs != self.inputs:
+            self.surface = self.render(*inputs)
+            self.inputs = inputs
+        return self.surface
@@ -0,0 +1,40 @@
+from Cells.HelperCell import HelperTCell
+
+class AuraManager:
+    """Applies Helper T-Cell boosts, recomputing tower stats only when the tower layout changes.
+
+    Boosts from every Helper T-Cell in range stack additively, with the attack speed boost
+    capped at MAX_ATTACK_SPEED_BOOST. Helper T-Cells never boost each other.
+    """
+    MAX_ATTACK_SPEED_BOOST = 0.5
+
+    def __init__(self):
+        self.dirty = True
+
+    def mark_dirty(self):
+        """Flag that a tower was placed, upgraded or removed so boosts are recomputed."""
+        self.dirty = True
+
+    def refresh(self, towers):
+        """Recompute boosted stats for every tower if the layout changed since the last call.
+
+        Returns the towers whose attack cooldown or range changed.
+        """
+        if not self.dirty:
+            return []
+        self.dirty = False
+        changed = []
+        helpers = [tower for tower in towers if isinstance(tower, HelperTCell)]
+        for tower in towers:
+            if isinstance(tower, HelperTCell):
+                continue
+            sources = [helper for helper in helpers if helper.boosts_tower(tower)]
+            cooldown, range_radius = tower.cooldown, tower.range_radius
+            tower.apply_boosts(
+                sum(helper.damage_boost for helper in sources),
+                sum(helper.range_boost for helper in sources),
+                min(sum(helper.attack_speed_boost for helper in sources), self.MAX_ATTACK_SPEED_BOOST),
+            )
+            if tower.cooldown != cooldown or tower.range_radius != range_radius:
+                changed.append(tower)
+        return changed
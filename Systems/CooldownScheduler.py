@@ -0,0 +1,67 @@
+import heapq
+from itertools import count
+
+class CooldownScheduler:
+    """Min-heap of towers ordered by the simulation time their attack cooldown expires.
+
+    Rescheduling a tower doesn't search the heap: it pushes a new entry and bumps the tower's
+    version, and entries with an outdated version are skipped when they reach the top.
+
+    A ready tower with nothing in range is parked instead of retrying every step. It watches the
+    spatial grid cells its range covers and is handed back by wake() once an enemy is in one.
+    """
+    def __init__(self):
+        self.heap = []  # (ready time, tie-breaker, version, tower)
+        self.versions = {}
+        self.parked = {}  # Grid cell -> parked towers watching it
+        self.parked_cells = {}  # Parked tower -> the grid cells it watches
+        self._sequence = count()
+
+    def schedule(self, tower, ready_time):
+        """Set the time tower is next ready to attack, replacing any earlier schedule or parking."""
+        if tower in self.parked_cells:
+            self._unpark(tower)
+        version = self.versions.get(tower, 0) + 1
+        self.versions[tower] = version
+        heapq.heappush(self.heap, (ready_time, next(self._sequence), version, tower))
+
+    def park(self, tower, cells):
+        """Hold a ready tower that found no target until an enemy enters one of cells."""
+        self.parked_cells[tower] = cells
+        for cell in cells:
+            self.parked.setdefault(cell, []).append(tower)
+
+    def _unpark(self, tower):
+        """Stop a parked tower watching its grid cells."""
+        for cell in self.parked_cells.pop(tower):
+            towers = self.parked[cell]
+            towers.remove(tower)
+            if not towers:
+                del self.parked[cell]
+
+    def wake(self, occupied):
+        """Unpark and return the towers watching any of the occupied grid cells."""
+        parked = self.parked
+        if not parked:
+            return []
+        woken = {}
+        for cell in occupied:
+            towers = parked.get(cell)
+            if towers:
+                woken.update(dict.fromkeys(towers))
+        for tower in woken:
+            self._unpark(tower)
+        return list(woken)
+
+    def pop_ready(self, now):
+        """Remove and return every tower whose cooldown has expired by now, earliest first."""
+        heap, versions = self.heap, self.versions
+        ready = []
+        while heap and heap[0][0] <= now:
+            _, _, version, tower = heapq.heappop(heap)
+            if versions.get(tower) == version:
+                ready.append(tower)
+        return ready
+
+    def __len__(self):
+        return len(self.versions)
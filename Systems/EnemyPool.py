@@ -0,0 +1,20 @@
+class EnemyPool:
+    """Reuses enemies that died or leaked for later spawns instead of constructing new ones."""
+    def __init__(self):
+        self.free = {}  # Enemy class -> enemies ready for reuse
+
+    def acquire(self, enemy_class, path_index):
+        """Return an enemy of the given class at the start of a path, reused if one is free."""
+        free = self.free.get(enemy_class)
+        if free:
+            enemy = free.pop()
+            enemy.reset(path_index)
+            return enemy
+        return enemy_class(path_index)
+
+    def release(self, enemy):
+        """Return an enemy that left the map to the pool."""
+        self.free.setdefault(type(enemy), []).append(enemy)
+
+    def __len__(self):
+        return sum(len(free) for free in self.free.values())
@@ -0,0 +1,210 @@
+from Enemies.Enemy import Enemy
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the array-backed enemy backend
+    np = None
+
+class EnemyView:
+    """Enemy-compatible handle onto one slot of an EnemyStore; type data comes from the source enemy."""
+    __slots__ = ("store", "slot", "template")
+
+    def __init__(self, store, slot, template):
+        self.store = store
+        self.slot = slot
+        self.template = template
+
+    def __getattr__(self, name):
+        # Only reached for attributes without a store-backed property (images, width, money, ...)
+        return getattr(self.template, name)
+
+    def _field(array_name, attr, cast):
+        def get(self):
+            if self.store is None:
+                return getattr(self.template, attr)
+            return cast(getattr(self.store, array_name)[self.slot])
+
+        def set(self, value):
+            if self.store is None:
+                setattr(self.template, attr, value)
+            else:
+                getattr(self.store, array_name)[self.slot] = value
+        return property(get, set)
+
+    x = _field("x", "x", float)
+    y = _field("y", "y", float)
+    prev_x = _field("prev_x", "prev_x", float)
+    prev_y = _field("prev_y", "prev_y", float)
+    distance = _field("distance", "distance", float)
+    velocity = _field("velocity", "velocity", float)
+    health = _field("health", "health", float)
+    path_pos = _field("path_pos", "path_pos", int)
+    animation_count = _field("animation_count", "animation_count", float)
+    flipped = _field("flipped", "flipped", bool)
+    is_finished = _field("finished", "is_finished", bool)
+    del _field
+
+    @property
+    def id(self):
+        return self.template.id
+
+    @id.setter
+    def id(self, value):
+        self.template.id = value
+
+    def hit(self, damage):
+        """Reduce enemy health by the given damage."""
+        self.health -= damage
+
+class EnemyStore:
+    """Struct-of-arrays storage for live enemies, advanced with one vectorized step per frame."""
+    FIELDS = (
+        ("x", "f8"), ("y", "f8"), ("prev_x", "f8"), ("prev_y", "f8"), ("distance", "f8"), ("velocity", "f8"), ("health", "f8"),
+        ("path_id", "intp"), ("path_pos", "intp"),
+        ("animation_count", "f8"), ("animation_speed", "f8"), ("frame_count", "f8"),
+        ("flipped", "?"), ("finished", "?"), ("alive", "?"),
+    )
+
+    def __init__(self, capacity=256):
+        if np is None:
+            raise ImportError("The numpy enemy backend requires NumPy to be installed")
+        # Flatten every path table into one array, offsetting each path's arc lengths so a single
+        # searchsorted call finds the segment of every enemy at once
+        self.path_offset = max(table.total_length for table in Enemy.PATH_TABLES) + 1.0
+        keys, local_lengths, starts, directions, first_row, totals, last_points = [], [], [], [], [], [], []
+        for i, table in enumerate(Enemy.PATH_TABLES):
+            first_row.append(len(keys))
+            keys.extend(length + i * self.path_offset for length in table.lengths[:-1])
+            local_lengths.extend(table.lengths[:-1])
+            starts.extend(table.points[:-1])
+            directions.extend(table.directions)
+            totals.append(table.total_length)
+            last_points.append(table.points[-1])
+        self.search_keys = np.array(keys)
+        self.flat_start_lengths = np.array(local_lengths)
+        self.flat_starts = np.array(starts, dtype=np.float64)
+        self.flat_directions = np.array(directions)
+        self.first_row = np.array(first_row)
+        self.segment_counts = np.array([len(table.directions) for table in Enemy.PATH_TABLES])
+        self.total_lengths = np.array(totals)
+        self.last_points = np.array(last_points, dtype=np.float64)
+        self.capacity = 0
+        self.free_slots = []
+        self.views = {}
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """Resize every array to the new capacity, keeping existing slots."""
+        for name, dtype in self.FIELDS:
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[:self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        self.free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def add(self, enemy):
+        """Copy a freshly spawned enemy into the arrays and return its view."""
+        if not self.free_slots:
+            self._grow(self.capacity * 2)
+        slot = self.free_slots.pop()
+        self.x[slot] = enemy.x
+        self.y[slot] = enemy.y
+        self.prev_x[slot] = enemy.prev_x
+        self.prev_y[slot] = enemy.prev_y
+        self.distance[slot] = enemy.distance
+        self.velocity[slot] = enemy.velocity
+        self.health[slot] = enemy.health
+        self.path_id[slot] = enemy.path_index
+        self.path_pos[slot] = enemy.path_pos
+        self.animation_count[slot] = enemy.animation_count
+        self.animation_speed[slot] = enemy.animation_speed
+        self.frame_count[slot] = len(enemy.images)
+        self.flipped[slot] = enemy.flipped
+        self.finished[slot] = enemy.is_finished
+        self.alive[slot] = True
+        view = EnemyView(self, slot, enemy)
+        self.views[slot] = view
+        return view
+
+    def release(self, view):
+        """Write the final state back to the source enemy and free the view's slot."""
+        slot = view.slot
+        enemy = view.template
+        enemy.x, enemy.y = float(self.x[slot]), float(self.y[slot])
+        enemy.prev_x, enemy.prev_y = float(self.prev_x[slot]), float(self.prev_y[slot])
+        enemy.distance = float(self.distance[slot])
+        enemy.health = float(self.health[slot])
+        enemy.path_pos = int(self.path_pos[slot])
+        enemy.animation_count = float(self.animation_count[slot])
+        enemy.flipped = bool(self.flipped[slot])
+        enemy.is_finished = bool(self.finished[slot])
+        view.store = None
+        self.alive[slot] = False
+        del self.views[slot]
+        self.free_slots.append(slot)
+
+    def step(self):
+        """Advance every live enemy along its path by its velocity, mirroring Enemy.move."""
+        active = np.flatnonzero(self.alive & ~self.finished)
+        if not len(active):
+            return
+        self.prev_x[active] = self.x[active]
+        self.prev_y[active] = self.y[active]
+        paths = self.path_id[active]
+        distance = self.distance[active] + self.velocity[active]
+        totals = self.total_lengths[paths]
+        at_end = distance >= totals
+        done = active[at_end]
+        self.distance[done] = totals[at_end]
+        self.x[done] = self.last_points[paths[at_end], 0]
+        self.y[done] = self.last_points[paths[at_end], 1]
+        self.finished[done] = True
+
+        moving = active[~at_end]
+        paths, distance = paths[~at_end], distance[~at_end]
+        rows = np.searchsorted(self.search_keys, distance + paths * self.path_offset, side="right") - 1
+        rows = np.clip(rows, self.first_row[paths], self.first_row[paths] + self.segment_counts[paths] - 1)
+        offset = distance - self.flat_start_lengths[rows]
+        self.distance[moving] = distance
+        self.path_pos[moving] = rows - self.first_row[paths]
+        self.x[moving] = self.flat_starts[rows, 0] + self.flat_directions[rows, 0] * offset
+        self.y[moving] = self.flat_starts[rows, 1] + self.flat_directions[rows, 1] * offset
+        self.flipped[moving] = self.flat_directions[rows, 0] < 0
+        counts = self.animation_count[moving] + self.animation_speed[moving]
+        counts[counts >= self.frame_count[moving]] = 0
+        self.animation_count[moving] = counts
+
+    def collect_removed(self):
+        """Return the views of enemies that died or reached the end of their path this frame."""
+        removed = self.alive & ((self.health <= 0) | self.finished)
+        return [self.views[slot] for slot in np.flatnonzero(removed).tolist()]
+
+    def remaining(self, views):
+        """Return how far each of the given views still has to travel, read from the arrays in one pass."""
+        slots = [view.slot for view in views]
+        return (self.total_lengths[self.path_id[slots]] - self.distance[slots]).tolist()
+
+    def draw(self, screen, alpha=1.0):
+        """Draw every live enemy, reading each array once instead of going through the views.
+
+        Returns the areas covered, one per enemy.
+        """
+        views = self.views
+        if not views:
+            return []
+        slots = list(views)
+        prev_x, prev_y = self.prev_x[slots], self.prev_y[slots]
+        xs = (prev_x + (self.x[slots] - prev_x) * alpha).tolist()
+        ys = (prev_y + (self.y[slots] - prev_y) * alpha).tolist()
+        frames = self.animation_count[slots].astype(np.intp).tolist()
+        flipped = self.flipped[slots].tolist()
+        health = self.health[slots].tolist()
+        draw_at = Enemy.draw_at
+        return [draw_at(screen, view.template.enemy_type, x, y, frame, flip, hp)
+                for view, x, y, frame, flip, hp in zip(views.values(), xs, ys, frames, flipped, health)]
+
+    def positions(self, views):
+        """Return (x, y) pairs for the given views, read from the arrays in one pass."""
+        slots = [view.slot for view in views]
+        return zip(self.x[slots].tolist(), self.y[slots].tolist())
@@ -0,0 +1,40 @@
+class EntityRegistry:
+    """Live entities keyed by stable integer IDs, iterated in spawn order with O(1) add and remove."""
+    def __init__(self):
+        self._entities = {}  # Dicts keep insertion order, so iteration follows spawn order
+        self._next_id = 1
+
+    def add(self, entity, entity_id=None):
+        """Assign the entity a new ID, or restore a saved one, and register it."""
+        if entity_id is None:
+            entity_id = self._next_id
+        self._next_id = max(self._next_id, entity_id + 1)
+        entity.id = entity_id
+        self._entities[entity_id] = entity
+        return entity_id
+
+    def remove(self, entity):
+        """Unregister an entity."""
+        del self._entities[entity.id]
+
+    def get(self, entity_id, default=None):
+        """Return the live entity with the given ID, or default if it is gone."""
+        return self._entities.get(entity_id, default)
+
+    @property
+    def next_id(self):
+        """The ID the next added entity will get."""
+        return self._next_id
+
+    @next_id.setter
+    def next_id(self, value):
+        self._next_id = value
+
+    def __iter__(self):
+        return iter(self._entities.values())
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, entity):
+        return self._entities.get(entity.id) is entity
@@ -0,0 +1,107 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame
+from AssetManager import AssetManager
+
+class _Span:
+    """Context manager that adds the time spent inside it to one phase of the current frame."""
+    __slots__ = ("profiler", "phase", "started")
+
+    def __init__(self, profiler, phase):
+        self.profiler = profiler
+        self.phase = phase
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, *exc):
+        frame = self.profiler.current
+        frame[self.phase] = frame.get(self.phase, 0.0) + (time.perf_counter() - self.started) * 1000
+
+class FrameProfiler:
+    """Per-phase frame timing that can be switched on at runtime, with an on-screen overlay and export."""
+    PHASES = ("events", "enemies", "cells", "projectiles", "draw")
+    FRAMES_KEPT = 1800
+    GRAPH_FRAMES = 120
+    BUDGET_MS = 1000 / 60
+    _null_span = nullcontext()
+
+    def __init__(self):
+        self.enabled = False
+        self.show_overlay = False
+        self.frames = deque(maxlen=self.FRAMES_KEPT)  # One dict of phase -> ms per frame
+        self.current = {}
+        self.frame_number = 0
+        self._frame_start = 0.0
+
+    def toggle(self):
+        """Switch both profiling and the overlay on or off.
+
+        Toggling happens mid-frame, after begin_frame was skipped, so enabling starts a fresh frame here.
+        """
+        self.enabled = self.show_overlay = not self.enabled
+        if self.enabled:
+            self.current = {}
+            self._frame_start = time.perf_counter()
+
+    def span(self, phase):
+        """Return a context manager timing phase, or a shared no-op one when profiling is off."""
+        if not self.enabled:
+            return self._null_span
+        return _Span(self, phase)
+
+    def begin_frame(self):
+        if self.enabled:
+            self.current = {}
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if self.enabled:
+            self.current["total"] = (time.perf_counter() - self._frame_start) * 1000
+            self.current["frame"] = self.frame_number
+            self.frames.append(self.current)
+        self.frame_number += 1
+
+    def export_csv(self, path):
+        """Write one row per recorded frame with the time of every phase in milliseconds."""
+        columns = ["frame", *self.PHASES, "total"]
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for frame in self.frames:
+                writer.writerow([frame.get(column, 0.0) for column in columns])
+
+    def export_json(self, path):
+        """Write the recorded frames as a JSON list of phase timings in milliseconds."""
+        with open(path, "w") as f:
+            json.dump({"phases": list(self.PHASES), "frames": list(self.frames)}, f)
+
+    def draw(self, screen, x=10, y=500):
+        """Draw a frame-time graph and the average per-phase breakdown; return the area covered."""
+        if not self.show_overlay:
+            return None
+        width, height, graph_height = 300, 200, 100
+        panel = pygame.Rect(x, y, width, height)
+        rect = pygame.draw.rect(screen, (20, 20, 20), panel)
+        recent = list(self.frames)[-self.GRAPH_FRAMES:]
+        scale = graph_height / (self.BUDGET_MS * 2)
+        bar_width = width / self.GRAPH_FRAMES
+        for i, frame in enumerate(recent):
+            bar = min(frame["total"] * scale, graph_height)
+            color = (220, 60, 60) if frame["total"] > self.BUDGET_MS else (60, 200, 90)
+            pygame.draw.rect(screen, color, (x + i * bar_width, y + graph_height - bar, max(bar_width, 1), bar))
+        budget_y = y + graph_height - self.BUDGET_MS * scale
+        pygame.draw.line(screen, (255, 255, 255), (x, budget_y), (x + width, budget_y))
+
+        font = AssetManager.get_font(None, 20)
+        last = recent[-30:]
+        for i, phase in enumerate((*self.PHASES, "total")):
+            average = sum(frame.get(phase, 0.0) for frame in last) / len(last) if last else 0.0
+            # Round so cached text only re-renders when the shown value changes
+            text = AssetManager.render_text(font, f"{phase}: {average:.1f} ms")
+            screen.blit(text, (x + 5 + (i // 3) * 150, y + graph_height + 8 + (i % 3) * 28))
+        return rect
@@ -0,0 +1,52 @@
+import struct
+
+# Recorded input actions
+PAUSE, BUY, PLACE, CANCEL, SELECT, UPGRADE, SPEED, TARGET = range(8)
+
+MAGIC = b"ISTR"
+VERSION = 1
+HEADER = struct.Struct("<4sBQ")  # Magic, format version, RNG seed
+RECORD = struct.Struct("<IBBhh")  # Simulation frame, action, small argument, x, y
+
+class InputRecorder:
+    """Collects game inputs with the simulation frame they were applied on."""
+    def __init__(self, seed):
+        self.seed = seed
+        self.records = bytearray()
+
+    def record(self, frame, action, arg=0, x=0, y=0):
+        """Append one input to the log."""
+        self.records += RECORD.pack(frame, action, arg, x, y)
+
+    def save(self, path):
+        """Write the seed and every recorded input to path."""
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed))
+            f.write(self.records)
+
+class InputReplay:
+    """Feeds a recorded input log back to the game on the frames the inputs were recorded on."""
+    def __init__(self, seed, records):
+        self.seed = seed
+        self.records = records  # List of (frame, action, arg, x, y), in frame order
+        self.position = 0
+
+    @classmethod
+    def load(cls, path):
+        """Read an input log written by InputRecorder.save."""
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, seed = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} input log")
+        return cls(seed, list(RECORD.iter_unpack(data[HEADER.size:])))
+
+    def due(self, frame):
+        """Yield (action, arg, x, y) for every input recorded on or before frame that hasn't been replayed."""
+        while self.position < len(self.records) and self.records[self.position][0] <= frame:
+            yield self.records[self.position][1:]
+            self.position += 1
+
+    @property
+    def finished(self):
+        return self.position >= len(self.records)
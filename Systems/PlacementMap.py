@@ -0,0 +1,53 @@
+import math
+import pygame
+
+class PlacementMap:
+    """Precomputed tower placement rules: a path mask dilated by the tower footprint and a tower occupancy grid."""
+    def __init__(self, background, path_color, footprint_radius=25, min_distance=50, tolerance=10):
+        self.width, self.height = background.get_size()
+        self.min_distance = min_distance
+        # Pixels within the colour tolerance of the path, grown by the footprint so towers can't overlap it
+        # Palette (8-bit) surfaces are compared by colour index, so threshold a 32-bit copy
+        pixels = pygame.Surface((self.width, self.height), pygame.SRCALPHA, 32)
+        pixels.blit(background, (0, 0))
+        path = pygame.mask.from_threshold(pixels, path_color, (tolerance, tolerance, tolerance, 255))
+        footprint = pygame.mask.Mask((footprint_radius * 2 + 1, footprint_radius * 2 + 1))
+        for fx in range(footprint_radius * 2 + 1):
+            for fy in range(footprint_radius * 2 + 1):
+                if math.hypot(fx - footprint_radius, fy - footprint_radius) <= footprint_radius:
+                    footprint.set_at((fx, fy))
+        self.blocked = path.convolve(footprint, pygame.mask.Mask((self.width, self.height)), (-footprint_radius, -footprint_radius))
+        self.occupied = {}  # Grid cell -> positions of towers in that cell
+        self._overlay = None
+
+    def _cell(self, x, y):
+        return int(x // self.min_distance), int(y // self.min_distance)
+
+    def is_valid(self, x, y):
+        """Check bounds, path clearance and spacing from other towers with constant-time lookups."""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        if self.blocked.get_at((int(x), int(y))):
+            return False
+        cx, cy = self._cell(x, y)
+        for nx in (cx - 1, cx, cx + 1):
+            for ny in (cy - 1, cy, cy + 1):
+                for tx, ty in self.occupied.get((nx, ny), ()):
+                    if math.hypot(tx - x, ty - y) < self.min_distance:
+                        return False
+        return True
+
+    def add_tower(self, x, y):
+        """Mark a tower position as occupied."""
+        self.occupied.setdefault(self._cell(x, y), []).append((x, y))
+        self._overlay = None
+
+    def get_overlay(self):
+        """Return a translucent Surface tinting every spot where a tower can't be placed."""
+        if self._overlay is None:
+            color = (255, 0, 0, 70)
+            self._overlay = self.blocked.to_surface(setcolor=color, unsetcolor=(0, 0, 0, 0))
+            for positions in self.occupied.values():
+                for x, y in positions:
+                    pygame.draw.circle(self._overlay, color, (x, y), self.min_distance)
+        return self._overlay
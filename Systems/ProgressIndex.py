@@ -0,0 +1,57 @@
+class ProgressIndex:
+    """Live enemies ordered by how far they still have to go, the one nearest its exit first.
+
+    Enemies barely change places between frames, so the order is kept from frame to frame and
+    repaired with one insertion-sort pass, which is linear when only a few enemies overtake others.
+    """
+    # Above this share of newly added enemies in one update, a full sort beats insertion
+    BULK_ADD_RATIO = 0.25
+
+    def __init__(self):
+        self.order = []
+        self.added = 0
+
+    def add(self, enemy):
+        """Start tracking a newly spawned enemy; it is placed on the next update."""
+        self.order.append(enemy)
+        self.added += 1
+
+    def update(self, removed=(), remaining_of=None):
+        """Drop the removed enemies and restore the order after movement.
+
+        remaining_of maps a list of enemies to their remaining path distances, for backends that
+        can read them faster than one attribute at a time.
+        """
+        order = self.order
+        if removed:
+            gone = set(map(id, removed))
+            order = [enemy for enemy in order if id(enemy) not in gone]
+        if remaining_of is None:
+            remaining = [enemy.path_table.total_length - enemy.distance for enemy in order]
+        else:
+            remaining = remaining_of(order)
+        bulk = self.added > len(order) * self.BULK_ADD_RATIO
+        self.added = 0
+        if bulk:
+            ranked = sorted(range(len(order)), key=remaining.__getitem__)
+            self.order = [order[i] for i in ranked]
+            return
+        for i in range(1, len(order)):
+            key = remaining[i]
+            if key >= remaining[i - 1]:
+                continue
+            enemy = order[i]
+            j = i - 1
+            while j >= 0 and remaining[j] > key:
+                remaining[j + 1] = remaining[j]
+                order[j + 1] = order[j]
+                j -= 1
+            remaining[j + 1] = key
+            order[j + 1] = enemy
+        self.order = order
+
+    def __iter__(self):
+        return iter(self.order)
+
+    def __len__(self):
+        return len(self.order)
@@ -0,0 +1,92 @@
+import math
+from array import array
+
+class ProjectileSystem:
+    """Pooled, array-backed projectile storage shared by every shooting tower.
+
+    Live projectiles are packed at the front of preallocated arrays; a despawn moves the last live
+    projectile into the freed slot, so spawns and despawns are O(1) and storage is reused.
+    """
+    HIT_RADIUS = 10
+
+    def __init__(self, capacity=256):
+        self.count = 0
+        self.capacity = 0
+        self.x = array("d")
+        self.y = array("d")
+        self.prev_x = array("d")  # Position before the last update, for interpolated drawing
+        self.prev_y = array("d")
+        self.speed = array("d")
+        self.damage = array("d")
+        self.target = array("q")  # Enemy ID of each projectile's target
+        self.images = []
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """Extend every array to the new capacity."""
+        extra = capacity - self.capacity
+        for column in (self.x, self.y, self.prev_x, self.prev_y, self.speed, self.damage):
+            column.extend(array("d", bytes(8 * extra)))
+        self.target.extend(array("q", bytes(8 * extra)))
+        self.images.extend([None] * extra)
+        self.capacity = capacity
+
+    def spawn(self, x, y, target_id, speed, damage, image):
+        """Launch a projectile from (x, y) towards the enemy with the given ID."""
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        i = self.count
+        self.x[i], self.y[i] = x, y
+        self.prev_x[i], self.prev_y[i] = x, y
+        self.speed[i] = speed
+        self.damage[i] = damage
+        self.target[i] = target_id
+        self.images[i] = image
+        self.count += 1
+
+    def _despawn(self, i):
+        """Free slot i by moving the last live projectile into it."""
+        last = self.count - 1
+        if i != last:
+            self.x[i], self.y[i] = self.x[last], self.y[last]
+            self.prev_x[i], self.prev_y[i] = self.prev_x[last], self.prev_y[last]
+            self.speed[i] = self.speed[last]
+            self.damage[i] = self.damage[last]
+            self.target[i] = self.target[last]
+            self.images[i] = self.images[last]
+        self.images[last] = None
+        self.count = last
+
+    def update(self, enemies_by_id):
+        """Move every projectile towards its target in one pass, applying damage on hit."""
+        x, y, speed, target = self.x, self.y, self.speed, self.target
+        prev_x, prev_y = self.prev_x, self.prev_y
+        i = 0
+        while i < self.count:
+            enemy = enemies_by_id.get(target[i])
+            if enemy is None:
+                # The target died or leaked since the projectile was fired
+                self._despawn(i)
+                continue
+            dx, dy = enemy.x - x[i], enemy.y - y[i]
+            dist = math.hypot(dx, dy)
+            # Also a hit when the target is within this step's travel, so fast shots can't pass through it
+            if dist < self.HIT_RADIUS or dist <= speed[i]:
+                enemy.hit(self.damage[i])
+                self._despawn(i)
+                continue
+            prev_x[i], prev_y[i] = x[i], y[i]
+            x[i] += (dx / dist) * speed[i]
+            y[i] += (dy / dist) * speed[i]
+            i += 1
+
+    def draw(self, screen, alpha=1.0):
+        """Draw all projectiles, interpolated alpha of the way through the last step, and return the area they covered."""
+        x, y, prev_x, prev_y = self.x, self.y, self.prev_x, self.prev_y
+        rects = []
+        for i in range(self.count):
+            img = self.images[i]
+            px = prev_x[i] + (x[i] - prev_x[i]) * alpha
+            py = prev_y[i] + (y[i] - prev_y[i]) * alpha
+            rects.append(screen.blit(img, (px - img.get_width() // 2, py - img.get_height() // 2)))
+        return rects[0].unionall(rects[1:]) if rects else None
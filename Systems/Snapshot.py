@@ -0,0 +1,129 @@
+"""Compact, versioned binary snapshots of the full game state.
+
+Layout: header, game state, RNG state, then the live enemies, pending wave enemies and towers as
+fixed-size records, and the projectile columns as raw arrays. Images and other assets aren't
+stored; restoring rebuilds entities from their type codes.
+"""
+import struct
+from array import array
+
+from Cells.Cell import Cell
+from Cells.HelperCell import HelperTCell
+from Cells.Macrophage import Macrophage
+from Cells.Neutrophil import Neutrophil
+from Enemies.Waves import ENEMY_TYPES, WaveSchedule
+from AssetManager import AssetManager
+
+MAGIC = b"ISNP"
+VERSION = 1
+HEADER = struct.Struct("<4sB")
+# Frame, clock, lives, resources, wave, spawn timer, wave cooldown, spawn delay, paused, speed, seed, next enemy ID
+STATE = struct.Struct("<IdiiIdddBBQQ")
+RNG = struct.Struct("<B625IBd")  # Version, Mersenne Twister state, has gauss_next, gauss_next
+COUNTS = struct.Struct("<IIII")  # Live enemies, pending enemies, towers, projectiles
+ENEMY = struct.Struct("<BBQdd")  # Type, path, ID, distance along path, health
+PENDING = struct.Struct("<BB")  # Type, path
+# Type, x, y, level, targeting policy, last attack time, target ID (-1 for none),
+# attack animation count, attacking, current animation frame
+TOWER = struct.Struct("<BhhBBdqd?B")
+
+TOWER_TYPES = (Neutrophil, Macrophage, HelperTCell)
+
+def _enemy_columns(game, enemies):
+    """Return the distance and health of every live enemy, read from the store arrays when in use."""
+    store = game.enemy_store
+    if store is None:
+        return [enemy.distance for enemy in enemies], [enemy.health for enemy in enemies]
+    slots = [enemy.slot for enemy in enemies]
+    return store.distance[slots].tolist(), store.health[slots].tolist()
+
+def dumps(game):
+    """Serialize the game state to bytes."""
+    parts = [HEADER.pack(MAGIC, VERSION)]
+    parts.append(STATE.pack(
+        game.frame, game.clock.get_ticks(), game.lives, game.resources, game.current_wave,
+        game.spawn_timer, game.wave_cooldown, game.spawn_delay, game.is_paused, game.speed,
+        game.seed, game.enemies.next_id,
+    ))
+    version, state, gauss_next = game.rng.getstate()
+    parts.append(RNG.pack(version, *state, gauss_next is not None, gauss_next or 0.0))
+
+    enemies = list(game.enemies)
+    projectiles = game.projectiles
+    parts.append(COUNTS.pack(len(enemies), len(game.wave_enemies), len(game.cells), projectiles.count))
+    pack = ENEMY.pack
+    type_codes = {enemy_type: code for code, enemy_type in enumerate(ENEMY_TYPES)}
+    sources = [getattr(enemy, "template", enemy) for enemy in enemies]
+    distances, healths = _enemy_columns(game, enemies)
+    parts.extend(pack(type_codes[type(enemy)], enemy.path_index, enemy.id, distance, health)
+                 for enemy, distance, health in zip(sources, distances, healths))
+    parts.extend(PENDING.pack(type_code, path_index) for type_code, path_index in game.wave_enemies)
+    for tower in game.cells:
+        parts.append(TOWER.pack(
+            TOWER_TYPES.index(type(tower)), int(tower.x), int(tower.y), tower.level,
+            Cell.TARGETING_POLICIES.index(tower.targeting), tower.last_attack_time,
+            -1 if tower.target_id is None else tower.target_id,
+            getattr(tower, "attack_animation_count", 0), getattr(tower, "is_attacking", False),
+            getattr(tower, "current_frame", 0),
+        ))
+    count = projectiles.count
+    for column in (projectiles.x, projectiles.y, projectiles.speed, projectiles.damage, projectiles.target):
+        parts.append(column[:count].tobytes())
+    return b"".join(parts)
+
+def loads(game, data):
+    """Restore a state written by dumps into a newly constructed game."""
+    magic, version = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"not a version {VERSION} game snapshot")
+    offset = HEADER.size
+    (game.frame, clock, game.lives, game.resources, game.current_wave, game.spawn_timer,
+     game.wave_cooldown, game.spawn_delay, paused, game.speed, game.seed, next_id) = STATE.unpack_from(data, offset)
+    game.is_paused = bool(paused)
+    game.clock.reset(clock)
+    offset += STATE.size
+    rng = RNG.unpack_from(data, offset)
+    game.rng.setstate((rng[0], rng[1:626], rng[627] if rng[626] else None))
+    offset += RNG.size
+    enemy_count, pending_count, tower_count, projectile_count = COUNTS.unpack_from(data, offset)
+    offset += COUNTS.size
+
+    for type_code, path_index, enemy_id, distance, health in ENEMY.iter_unpack(data[offset:offset + enemy_count * ENEMY.size]):
+        enemy = game.create_enemy(ENEMY_TYPES[type_code], path_index)
+        enemy.set_distance(distance)
+        enemy.health = health
+        game.spawn_enemy(enemy, enemy_id)
+    game.enemies.next_id = next_id
+    offset += enemy_count * ENEMY.size
+
+    pending = data[offset:offset + pending_count * PENDING.size]
+    game.wave_enemies = WaveSchedule(pending[0::2], pending[1::2])
+    offset += pending_count * PENDING.size
+
+    for record in TOWER.iter_unpack(data[offset:offset + tower_count * TOWER.size]):
+        type_code, x, y, level, policy, last_attack, target_id, animation, attacking, frame = record
+        tower = TOWER_TYPES[type_code](x, y, game.menu_bg, game.upgrade_button)
+        for _ in range(level - 1):
+            tower.upgrade()
+        tower.targeting = Cell.TARGETING_POLICIES[policy]
+        tower.last_attack_time = last_attack
+        tower.target_id = None if target_id < 0 else target_id
+        if hasattr(tower, "attack_animation_count"):
+            tower.attack_animation_count = animation
+        if hasattr(tower, "is_attacking"):
+            tower.is_attacking = attacking
+            tower.current_frame = frame
+        game.add_tower(tower)
+    offset += tower_count * TOWER.size
+
+    projectiles = game.projectiles
+    image = AssetManager.load_image(Neutrophil.PROJECTILE_IMAGE)
+    columns = []
+    for typecode in "ddddq":
+        column = array(typecode)
+        size = projectile_count * column.itemsize
+        column.frombytes(data[offset:offset + size])
+        columns.append(column)
+        offset += size
+    for x, y, speed, damage, target in zip(*columns):
+        projectiles.spawn(x, y, target, speed, damage, image)
@@ -0,0 +1,64 @@
+import math
+
+class SpatialGrid:
+    """Uniform grid of enemy positions used to answer tower range queries."""
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.enemies = []
+
+    def rebuild(self, enemies, positions=None, ordered=None):
+        """Re-bucket every enemy by its current position, once per frame after movement.
+
+        ordered lists the live enemies in the order queries return them, by default the order of
+        enemies; positions, if given, follow the same order.
+        """
+        self.enemies = enemies
+        self.buckets = {}
+        if ordered is None:
+            ordered = enemies
+        if positions is None:
+            positions = [(enemy.x, enemy.y) for enemy in ordered]
+        size = self.cell_size
+        for order, (enemy, (x, y)) in enumerate(zip(ordered, positions)):
+            key = (int(x // size), int(y // size))
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                self.buckets[key] = [(order, enemy, x, y)]
+            else:
+                bucket.append((order, enemy, x, y))
+
+    def query(self, x, y, radius):
+        """Return the enemies within radius of (x, y), in query order."""
+        size = self.cell_size
+        found = []
+        for cx in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for cy in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                bucket = self.buckets.get((cx, cy))
+                if bucket is None:
+                    continue
+                for order, enemy, ex, ey in bucket:
+                    if math.hypot(x - ex, y - ey) <= radius:
+                        found.append((order, enemy))
+        found.sort(key=lambda item: item[0])
+        return [enemy for _, enemy in found]
+
+    def cells_in_range(self, x, y, radius):
+        """Return the keys of every grid cell a query of radius around (x, y) looks at."""
+        size = self.cell_size
+        return [(cx, cy)
+                for cx in range(int((x - radius) // size), int((x + radius) // size) + 1)
+                for cy in range(int((y - radius) // size), int((y + radius) // size) + 1)]
+
+    def get(self, enemy_id, default=None):
+        """Return the live enemy with the given ID from the underlying registry."""
+        return self.enemies.get(enemy_id, default)
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def __contains__(self, enemy):
+        return enemy in self.enemies
@@ -0,0 +1,55 @@
+"""Pack every sprite in AssetManager.MANIFEST, pre-scaled, into one atlas image plus a JSON index.
+
+Run from the project root:  python -m Tools.bake_assets
+"""
+import json
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from AssetManager import AssetManager
+
+ATLAS_WIDTH = 1024
+PADDING = 1
+
+def pack(images):
+    """Place images on shelves of an ATLAS_WIDTH-wide sheet, tallest first; return positions and sheet height."""
+    order = sorted(range(len(images)), key=lambda i: images[i].get_height(), reverse=True)
+    positions = [None] * len(images)
+    x = y = shelf_height = 0
+    for i in order:
+        width, height = images[i].get_size()
+        if x + width > ATLAS_WIDTH:
+            x, y = 0, y + shelf_height + PADDING
+            shelf_height = 0
+        positions[i] = (x, y)
+        x += width + PADDING
+        shelf_height = max(shelf_height, height)
+    return positions, y + shelf_height
+
+def bake():
+    """Decode and scale every manifest entry exactly as the runtime does, then write the atlas and index."""
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+    entries, images = [], []
+    for path, size in AssetManager.MANIFEST:
+        image = AssetManager._load_from_disk(path, size)
+        if image is None:
+            continue
+        entries.append((path, size))
+        images.append(image)
+    positions, height = pack(images)
+    atlas = pygame.Surface((ATLAS_WIDTH, height), pygame.SRCALPHA)
+    index = []
+    for (path, size), image, pos in zip(entries, images, positions):
+        # Copy pixels as-is instead of alpha-blending onto the empty sheet
+        atlas.blit(image, pos, special_flags=pygame.BLEND_RGBA_MAX)
+        index.append({"path": path, "size": list(size) if size else None, "rect": [*pos, *image.get_size()]})
+    pygame.image.save(atlas, AssetManager.ATLAS_PATH)
+    with open(AssetManager.ATLAS_INDEX_PATH, "w") as f:
+        json.dump(index, f, indent=1)
+    print(f"Baked {len(index)} sprites into {AssetManager.ATLAS_PATH} ({ATLAS_WIDTH}x{height})")
+
+if __name__ == "__main__":
+    bake()
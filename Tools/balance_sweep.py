@@ -0,0 +1,174 @@
+"""Run many seeded headless games across every core and aggregate balance results per configuration.
+
+Run from the project root:
+    python -m Tools.balance_sweep --seeds 50 --waves 15 --output sweep.npz
+    python -m Tools.balance_sweep --configs my_configs.json --output sweep.json
+
+A config file is a JSON list of objects with a "name" and any of "layout" ([tower, x, y] entries
+built in order as soon as they are affordable), "tower_costs", "wave_tiers" and "enemy_stats",
+which are passed straight to Game. "enemy_stats" maps an enemy class name to new values for any
+of max_health, velocity, money and animation_speed.
+"""
+import argparse
+import itertools
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+try:
+    import numpy as np
+except ImportError:  # Fall back to column-oriented JSON output
+    np = None
+
+from game import Game
+from Systems import InputLog
+
+LAYOUTS = {
+    "neutrophil_line": [("Neutrophil", 450, 260), ("Neutrophil", 600, 300), ("Neutrophil", 800, 400),
+                        ("Neutrophil", 700, 480), ("Neutrophil", 500, 450), ("Neutrophil", 350, 500)],
+    "mixed": [("Neutrophil", 450, 260), ("Macrophage", 600, 300), ("Neutrophil", 800, 400),
+              ("HelperTCell", 700, 480), ("Macrophage", 500, 450), ("Neutrophil", 900, 200)],
+    "macrophage_helper": [("Macrophage", 600, 300), ("HelperTCell", 450, 260), ("Macrophage", 500, 450),
+                          ("Macrophage", 800, 400), ("HelperTCell", 700, 480), ("Macrophage", 350, 500)],
+}
+
+COST_SETS = {
+    "default": {},
+    "cheap_neutrophil": {"Neutrophil": 80},
+    "pricey_macrophage": {"Macrophage": 200},
+}
+
+TIER_SETS = {
+    "default": None,
+    "early_cancer": ((3, (0.8, 0.15, 0.05)), (6, (0.6, 0.3, 0.1)), (None, (0.45, 0.3, 0.25))),
+}
+
+RUN_COLUMNS = ("config", "seed", "waves_cleared", "lives_lost", "resources_spent", "frames", "mean_frame_ms")
+
+def default_configs():
+    """Every combination of the built-in layouts, tower costs and wave tiers."""
+    configs = []
+    for layout, costs, tiers in itertools.product(LAYOUTS, COST_SETS, TIER_SETS):
+        configs.append({
+            "name": f"{layout}/{costs}/{tiers}",
+            "layout": LAYOUTS[layout],
+            "tower_costs": COST_SETS[costs],
+            "wave_tiers": TIER_SETS[tiers],
+        })
+    return configs
+
+def build_affordable(game, queue, shop_index):
+    """Buy and place queued towers in order while resources allow; return the resources spent."""
+    spent = 0
+    while queue:
+        name, x, y = queue[0]
+        index = shop_index[name]
+        cost = game.shop.towers[index][2]
+        if game.resources < cost:
+            break
+        queue.pop(0)
+        before = game.resources
+        game.perform(InputLog.BUY, index, x, y)
+        game.perform(InputLog.PLACE, 0, x, y)
+        spent += before - game.resources
+    return spent
+
+def play(job):
+    """Play one seeded game with a configuration and return its result row."""
+    config_index, config, seed, max_wave, max_frames = job
+    game = Game(headless=True, seed=seed, tower_costs=config.get("tower_costs"),
+                wave_tiers=config.get("wave_tiers"), enemy_stats=config.get("enemy_stats"))
+    starting_lives = game.lives
+    shop_index = {tower[0].__name__: i for i, tower in enumerate(game.shop.towers)}
+    queue = [tuple(entry) for entry in config.get("layout", ())]
+    spent = 0
+    frames = 0
+    step_time = 0.0
+    while game.lives > 0 and game.current_wave <= max_wave and frames < max_frames:
+        spent += build_affordable(game, queue, shop_index)
+        if game.is_paused:
+            game.perform(InputLog.PAUSE)
+        started = time.perf_counter()
+        game.step()
+        step_time += time.perf_counter() - started
+        frames += 1
+    return {
+        "config": config_index,
+        "seed": seed,
+        "waves_cleared": game.current_wave - 1,
+        "lives_lost": starting_lives - game.lives,
+        "resources_spent": spent,
+        "frames": frames,
+        "mean_frame_ms": step_time * 1000 / max(frames, 1),
+    }
+
+def summarize(configs, runs):
+    """Aggregate run rows into one column set per configuration."""
+    columns = {"name": [], "runs": [], "mean_waves_cleared": [], "min_waves_cleared": [],
+               "mean_lives_lost": [], "mean_resources_spent": [], "mean_frame_ms": []}
+    for index, config in enumerate(configs):
+        rows = [i for i, c in enumerate(runs["config"]) if c == index]
+        if not rows:
+            continue
+        waves = [runs["waves_cleared"][i] for i in rows]
+        columns["name"].append(config["name"])
+        columns["runs"].append(len(rows))
+        columns["mean_waves_cleared"].append(statistics.fmean(waves))
+        columns["min_waves_cleared"].append(min(waves))
+        columns["mean_lives_lost"].append(statistics.fmean(runs["lives_lost"][i] for i in rows))
+        columns["mean_resources_spent"].append(statistics.fmean(runs["resources_spent"][i] for i in rows))
+        columns["mean_frame_ms"].append(statistics.fmean(runs["mean_frame_ms"][i] for i in rows))
+    return columns
+
+def write_columns(path, runs, summary):
+    """Write runs and the per-configuration summary column by column, as .npz when NumPy is available."""
+    if np is not None and path.endswith(".npz"):
+        arrays = {f"run_{name}": np.asarray(values) for name, values in runs.items()}
+        arrays.update({f"config_{name}": np.asarray(values) for name, values in summary.items()})
+        np.savez(path, **arrays)
+    else:
+        with open(path, "w") as f:
+            json.dump({"runs": runs, "configs": summary}, f)
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo balance sweep over headless seeded games.")
+    parser.add_argument("--configs", metavar="FILE", help="JSON list of configurations (default: built-in grid)")
+    parser.add_argument("--seeds", type=int, default=20, help="games per configuration")
+    parser.add_argument("--first-seed", type=int, default=0)
+    parser.add_argument("--waves", type=int, default=15, help="stop once this wave is cleared")
+    parser.add_argument("--max-frames", type=int, default=100000, help="frame cap per game")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--output", default="sweep.npz" if np is not None else "sweep.json")
+    args = parser.parse_args()
+
+    if args.configs:
+        with open(args.configs) as f:
+            configs = json.load(f)
+    else:
+        configs = default_configs()
+    jobs = [(index, config, seed, args.waves, args.max_frames)
+            for index, config in enumerate(configs)
+            for seed in range(args.first_seed, args.first_seed + args.seeds)]
+
+    runs = {name: [] for name in RUN_COLUMNS}
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        # Small chunks keep every worker busy even though game lengths vary a lot
+        for row in executor.map(play, jobs, chunksize=max(1, len(jobs) // (args.workers * 8))):
+            for name in RUN_COLUMNS:
+                runs[name].append(row[name])
+    summary = summarize(configs, runs)
+    write_columns(args.output, runs, summary)
+
+    print(f"{len(jobs)} games on {args.workers} workers in {time.perf_counter() - started:.1f}s -> {args.output}")
+    for i, name in enumerate(summary["name"]):
+        print(f"{name:50} waves {summary['mean_waves_cleared'][i]:5.1f} (min {summary['min_waves_cleared'][i]:3})  "
+              f"lives lost {summary['mean_lives_lost'][i]:6.1f}  spent {summary['mean_resources_spent'][i]:7.1f}  "
+              f"{summary['mean_frame_ms'][i]:.3f} ms/frame")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Time the game's hot paths on repeatable late-game scenarios and write a JSON report.
+
+Run from the project root:
+    python -m Tools.benchmark --frames 300 --output bench.json
+    python -m Tools.benchmark --compare bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from game import FRAME_MS, Game
+from Cells.HelperCell import HelperTCell
+from Cells.Macrophage import Macrophage
+from Cells.Neutrophil import Neutrophil
+from Enemies.Bacteria import Bacteria
+from Enemies.Cancer import Cancer
+from Enemies.Virus import Virus
+from Enemies.Waves import ENEMY_TYPES
+
+PHASES = ("update_enemies", "update_cells", "update_projectiles", "draw")
+SEED = 1234
+
+def free_spots(game, count, step=40):
+    """Yield up to count valid tower positions, scanning the map in a fixed order.
+
+    Each spot is checked when it is reached, so the caller must place a tower there with
+    game.add_tower before asking for the next one.
+    """
+    found = 0
+    for y in range(60, 620, step):
+        for x in range(30, 1260, step):
+            if game.is_valid_placement(x, y):
+                yield x, y
+                found += 1
+                if found == count:
+                    return
+
+def spawn_spread(game, enemies):
+    """Spawn enemies immediately, spread evenly along their paths."""
+    for i, enemy in enumerate(enemies):
+        enemy.set_distance(enemy.path_table.total_length * i / max(len(enemies), 1))
+        game.spawn_enemy(enemy)
+
+def start(game):
+    """Unpause without generating the first wave, with enough lives that the run never ends."""
+    game.is_paused = False
+    game.current_wave = max(game.current_wave, 1)
+    game.lives = 10 ** 6
+
+def neutrophils_vs_wave_60(game):
+    """50 Neutrophils against the full wave 60 spawned at once."""
+    for x, y in free_spots(game, 50):
+        game.add_tower(Neutrophil(x, y, game.menu_bg, game.upgrade_button))
+    game.current_wave = 59
+    game.generate_wave()
+    spawn_spread(game, [game.create_enemy(ENEMY_TYPES[type_code], path_index)
+                        for type_code, path_index in game.wave_enemies])
+    game.wave_enemies.clear()
+    start(game)
+
+def macrophage_cluster(game):
+    """A ring of Macrophages boosted by 5 stacked Helper T-Cells, against a steady stream of enemies."""
+    cx, cy = 620, 280
+    for i in range(12):
+        x = cx + (i % 4) * 45
+        y = cy + (i // 4) * 45
+        game.add_tower(Macrophage(x, y, game.menu_bg, game.upgrade_button))
+    for i in range(5):
+        game.add_tower(HelperTCell(cx + 60 + i * 5, cy + 45, game.menu_bg, game.upgrade_button))
+    spawn_spread(game, [(Virus, Bacteria, Cancer)[i % 3](i % 3) for i in range(300)])
+    start(game)
+
+def path_flood(game):
+    """1000 enemies on the paths with no towers, isolating movement and drawing."""
+    spawn_spread(game, [(Virus, Bacteria, Cancer)[i % 3](i % 3) for i in range(1000)])
+    start(game)
+
+def towers_fired(game):
+    """Count the damaging towers that have attacked at least once."""
+    return sum(1 for cell in game.cells if cell.damage > 0 and cell.last_attack_time > 0)
+
+SCENARIOS = {
+    "neutrophils_vs_wave_60": neutrophils_vs_wave_60,
+    "macrophage_cluster": macrophage_cluster,
+    "path_flood_1000": path_flood,
+}
+
+def percentiles(samples):
+    """Summarize frame times in milliseconds."""
+    ordered = sorted(samples)
+    def pick(q):
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": pick(0.50),
+        "p90_ms": pick(0.90),
+        "p99_ms": pick(0.99),
+        "max_ms": ordered[-1],
+    }
+
+def run_scenario(name, frames, enemy_backend):
+    """Build a scenario, time each phase over frames, then measure allocations in a second pass.
+
+    The phases are called directly rather than through Game.step, so the simulation clock is advanced
+    here once per frame; without it no tower cooldown would ever expire.
+    """
+    results = {}
+    game = Game(enemy_backend=enemy_backend, seed=SEED)
+    SCENARIOS[name](game)
+    timings = {phase: [] for phase in PHASES}
+    for _ in range(frames):
+        game.clock.advance(FRAME_MS)
+        for phase in PHASES:
+            started = time.perf_counter()
+            getattr(game, phase)()
+            timings[phase].append((time.perf_counter() - started) * 1000)
+    for phase in PHASES:
+        results[phase] = percentiles(timings[phase])
+    results["towers_fired"] = towers_fired(game)
+    if game.cells and not results["towers_fired"]:
+        raise RuntimeError(f"{name}: no tower attacked in {frames} frames, so tower work was not measured")
+
+    # Allocation tracking slows every call, so it runs on a fresh copy of the scenario
+    game = Game(enemy_backend=enemy_backend, seed=SEED)
+    SCENARIOS[name](game)
+    alloc_frames = max(frames // 5, 1)
+    tracemalloc.start()
+    for phase in PHASES:
+        results[phase]["alloc_kb_per_frame"] = 0.0
+        results[phase]["peak_kb"] = 0.0
+    for _ in range(alloc_frames):
+        game.clock.advance(FRAME_MS)
+        for phase in PHASES:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            getattr(game, phase)()
+            after, peak = tracemalloc.get_traced_memory()
+            results[phase]["alloc_kb_per_frame"] += (after - before) / 1024 / alloc_frames
+            results[phase]["peak_kb"] = max(results[phase]["peak_kb"], (peak - before) / 1024)
+    tracemalloc.stop()
+    results["enemies_at_end"] = len(game.enemies)
+    return results
+
+def compare(report, baseline):
+    """Print the change in mean and p99 frame time against a previous report."""
+    for name, phases in report["scenarios"].items():
+        if name not in baseline["scenarios"]:
+            continue
+        for phase in PHASES:
+            old, new = baseline["scenarios"][name][phase], phases[phase]
+            print(f"{name:26} {phase:15} mean {old['mean_ms']:8.3f} -> {new['mean_ms']:8.3f} ms   "
+                  f"p99 {old['p99_ms']:8.3f} -> {new['p99_ms']:8.3f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark late-game scenarios")
+    parser.add_argument("--frames", type=int, default=300, help="frames to time per scenario")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append", help="run only these scenarios")
+    parser.add_argument("--enemy-backend", choices=("objects", "numpy"), default="objects")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON report")
+    parser.add_argument("--compare", metavar="FILE", help="baseline report to compare against")
+    args = parser.parse_args()
+
+    report = {
+        "frames": args.frames,
+        "enemy_backend": args.enemy_backend,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "scenarios": {},
+    }
+    for name in args.scenario or sorted(SCENARIOS):
+        report["scenarios"][name] = result = run_scenario(name, args.frames, args.enemy_backend)
+        summary = ", ".join(f"{phase} {result[phase]['mean_ms']:.2f}/{result[phase]['p99_ms']:.2f}" for phase in PHASES)
+        print(f"{name}: mean/p99 ms {summary}")
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
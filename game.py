@@ -1,41 +1,115 @@
+import argparse
 import asyncio
+import base64
 import platform
 import os
 import math
 import random
+import struct
 import pygame
 from AssetManager import AssetManager
 from Cells.HelperCell import HelperTCell
 from Cells.Macrophage import Macrophage
 from Cells.Neutrophil import Neutrophil
-from Enemies.Bacteria import Bacteria
-from Enemies.Virus import Virus
-from Enemies.Cancer import Cancer
+from Enemies import Waves
+from Enemies.Waves import ENEMY_TYPES, WAVE_TIERS, WaveSchedule
 from Menu.Shop import Shop
 from Enemies.Enemy import Enemy
+from GameClock import GameClock
+from Systems.SpatialGrid import SpatialGrid
+from Systems.EnemyStore import EnemyStore
+from Systems.AuraManager import AuraManager
+from Systems.CooldownScheduler import CooldownScheduler
+from Systems.PlacementMap import PlacementMap
+from Systems.ProjectileSystem import ProjectileSystem
+from Systems.EntityRegistry import EntityRegistry
+from Systems.ProgressIndex import ProgressIndex
+from Systems.EnemyPool import EnemyPool
+from Rendering.DirtyRectRenderer import DirtyRectRenderer
+from Rendering.Layer import Layer
+from Systems import InputLog
+from Systems.InputLog import InputRecorder, InputReplay
+from Systems.FrameProfiler import FrameProfiler
+from Systems import Snapshot
+
+# The browser build is paced by the browser's frame callback instead of pygame's clock
+EMSCRIPTEN = platform.system() == "Emscripten"
+# The browser build autosaves under this localStorage key and resumes from it on the next visit
+BROWSER_SAVE = "immune-defense-autosave"
 
 # Game constants
-FPS = 30
+FPS = 30  # Simulation steps per second
+FRAME_MS = 1000 / FPS
+RENDER_FPS = 60
+MAX_CATCH_UP_STEPS = 5  # Steps run per rendered frame at most; longer stalls slow the game instead
+CHECKPOINT_FRAMES = FPS * 60  # Autosave this often mid-wave, on top of every new wave
+SEED_RANGE = 2 ** 64  # Seeds are stored as unsigned 64-bit values in recordings and snapshots
+SPEEDS = (1, 2, 4, 8)  # Fast-forward multipliers, cycled by the speed button
+FAST_SPEED = RENDER_FPS // FPS  # From this speed on, at least one step runs per rendered frame
 WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
-SPAWN_DELAY_BASE = 1000
+BACKGROUND_PATH = "Graphics/Background.gif"
 WAVE_COOLDOWN_DURATION = 5000
 MIN_TOWER_DISTANCE = 50
+TOWER_FOOTPRINT_RADIUS = 25
+GRID_CELL_SIZE = 64
+TOWER_COSTS = {"Neutrophil": 100, "Macrophage": 150, "HelperTCell": 120}
 
 class Game:
     """Main game class managing the tower defense game loop and state."""
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Tower Defense")
-        self.clock = pygame.time.Clock()
+    def __init__(self, headless=False, enemy_backend="objects", seed=None, replay=None, record=False,
+                 tower_costs=None, wave_tiers=None, enemy_stats=None, autosave=None):
+        # Only the subsystems the game uses; audio and joysticks are never started
+        pygame.font.init()
+        if not headless:
+            pygame.display.init()
+        self.headless = headless
+        # Game logic always runs on this game's own simulation clock so runs are reproducible
+        self.clock = GameClock()
+        if headless:
+            self.screen = None
+        else:
+            self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+            pygame.display.set_caption("Tower Defense")
+        self.frame_clock = pygame.time.Clock()
+
+        # A replay brings its own seed; otherwise use the given seed, wrapped into the stored range,
+        # or pick a fresh one
+        self.replay = replay
+        if replay is not None:
+            seed = replay.seed
+        self.seed = seed % SEED_RANGE if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.recorder = InputRecorder(self.seed) if record else None
+        self.frame = 0
+        self.profiler = FrameProfiler()
+        self.autosave_path = autosave
+        self.autosaved_wave = 0
+
+        # Balance settings, overridable for tuning sweeps
+        self.tower_costs = {**TOWER_COSTS, **(tower_costs or {})}
+        self.wave_tiers = wave_tiers or WAVE_TIERS
+        # Enemy class name -> {stat: value}, applied through a modified copy of the class's EnemyType
+        self.enemy_types = {
+            enemy_class: enemy_class.TYPE.with_overrides(**enemy_stats[enemy_class.__name__])
+            for enemy_class in ENEMY_TYPES if enemy_class.__name__ in (enemy_stats or {})
+        }
 
         # Load assets
         self._load_assets()
         self.path_color = self.background.get_at(Enemy.PATHS[0][0])
-        self.enemies = []
-        self.wave_enemies = []
+        self.placement = PlacementMap(self.background, self.path_color, TOWER_FOOTPRINT_RADIUS, MIN_TOWER_DISTANCE)
+        self.enemies = EntityRegistry()
+        # The "numpy" backend keeps live enemies in arrays and moves them in one vectorized step
+        self.enemy_store = EnemyStore() if enemy_backend == "numpy" else None
+        self.enemy_grid = SpatialGrid(GRID_CELL_SIZE)
+        self.progress = ProgressIndex()  # Live enemies nearest their exit first, the order grid queries use
+        self.wave_enemies = WaveSchedule()  # Type and path of each enemy still to spawn this wave
+        self.enemy_pool = EnemyPool()
         self.cells = []
+        self.auras = AuraManager()
+        self.cooldowns = CooldownScheduler()
+        self.projectiles = ProjectileSystem()
         self.lives = 100
         self.resources = 1000
         self.selected_tower = None
@@ -44,27 +118,32 @@ class Game:
         self.current_wave = 0
         self.spawn_timer = 0
         self.wave_cooldown = 0
-        self.spawn_delay = SPAWN_DELAY_BASE
+        self.spawn_delay = Waves.SPAWN_DELAY_BASE
         self.is_paused = True
         self.pause_button_rect = pygame.Rect(WINDOW_WIDTH - 70, 10, 60, 60)
+        self.speed_button_rect = pygame.Rect(WINDOW_WIDTH - 140, 10, 60, 60)
+        self.speed = 1
         self.running = True
 
         # Initialize shop centered at the bottom of the screen
         self._init_shop()
+        self.renderer = None if headless else DirtyRectRenderer(self.screen, self.background)
+        self.hud_layer = Layer(self._render_hud_icons)
+        self.speed_layer = Layer(self._render_speed_button)
 
     def _load_assets(self):
         """Load and cache shared images and fonts."""
         self.menu_bg = AssetManager.load_image("Game_assets/Menu/Shop_background.gif", (200, 150))
-        self.upgrade_button = AssetManager.load_image("Game_assets/UI/Upgrade_Button.gif", (50, 50))
+        self.upgrade_button = AssetManager.load_image("Game_assets/UI/Upgrade_button.gif", (50, 50))
         self.lives_img = AssetManager.load_image('Game_assets/Heart_icon.gif', (100, 100))
         self.resources_img = AssetManager.load_image('Game_assets/Resource_icon.gif', (100, 100))
         self.pause_button = AssetManager.load_image("Game_assets/UI/Pause_button.gif", (60, 60))
         self.play_button = AssetManager.load_image("Game_assets/UI/Play_button.gif", (60, 60))
-        self.background = AssetManager.load_image("Graphics/Background.gif", (WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.background = AssetManager.load_image(BACKGROUND_PATH, (WINDOW_WIDTH, WINDOW_HEIGHT))
         font_path = os.path.join("Game_assets", "Fonts", "PublicPixel-rv0pA.ttf")
-        self.pixel_font = pygame.font.Font(font_path, 34)
-        self.credit_font = pygame.font.Font(font_path, 16)
-        self.shop_font = pygame.font.Font(font_path, 18)  # Font for shop item prices
+        self.pixel_font = AssetManager.get_font(font_path, 34)
+        self.credit_font = AssetManager.get_font(font_path, 16)
+        self.shop_font = AssetManager.get_font(font_path, 18)  # Font for shop item prices
 
     def _init_shop(self):
         """Initialize the shop with tower options, positioned at the bottom center."""
@@ -74,161 +153,217 @@ class Game:
         helper_img = AssetManager.load_image("Game_assets/HelperCells/Helper_T_Cell.gif", (50, 50))
         # Create shop with towers, centered horizontally at y = WINDOW_HEIGHT - 60
         self.shop = Shop(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60, [
-            (Neutrophil, neutrophil_img, 100, self.menu_bg, self.upgrade_button),
-            (Macrophage, macrophage_img, 150, self.menu_bg, self.upgrade_button),
-            (HelperTCell, helper_img, 120, self.menu_bg, self.upgrade_button)
+            (Neutrophil, neutrophil_img, self.tower_costs["Neutrophil"], self.menu_bg, self.upgrade_button),
+            (Macrophage, macrophage_img, self.tower_costs["Macrophage"], self.menu_bg, self.upgrade_button),
+            (HelperTCell, helper_img, self.tower_costs["HelperTCell"], self.menu_bg, self.upgrade_button)
         ])
 
     def generate_wave(self):
-        """Generate enemies for the current wave based on wave number and probabilities."""
+        """Schedule the enemies of the next wave; they are built only as they spawn."""
         self.current_wave += 1
-        # Decrease spawn delay as waves progress, minimum 200ms
-        self.spawn_delay = max(200, SPAWN_DELAY_BASE - 100 * (self.current_wave - 1))
-        base_count = 10
-        scaling_factor = 5
-        enemy_count = base_count + scaling_factor * (self.current_wave - 1)
-
-        # Determine enemy type probabilities based on wave number
-        if self.current_wave <= 3:
-            virus_prob, bacteria_prob, cancer_prob = 0.9, 0.1, 0.0
-        elif self.current_wave <= 6:
-            virus_prob, bacteria_prob, cancer_prob = 0.7, 0.25, 0.05
-        else:
-            virus_prob, bacteria_prob, cancer_prob = 0.5, 0.3, 0.2
-
-        for _ in range(enemy_count):
-            rand = random.random()
-            path_index = random.randint(0, 2)
-            if rand < virus_prob:
-                enemy = Virus(path_index)
-            elif rand < virus_prob + bacteria_prob:
-                enemy = Bacteria(path_index)
-            else:
-                enemy = Cancer(path_index)
-            self.wave_enemies.append(enemy)
+        self.spawn_delay = Waves.spawn_delay(self.current_wave)
+        self.wave_enemies = Waves.build_wave(self.current_wave, self.rng, self.wave_tiers)
+
+    def create_enemy(self, enemy_class, path_index):
+        """Build an enemy of the given class on a path, reusing a pooled one and applying any stat overrides."""
+        enemy = self.enemy_pool.acquire(enemy_class, path_index)
+        enemy_type = self.enemy_types.get(enemy_class)
+        if enemy_type is not None and enemy.enemy_type is not enemy_type:
+            enemy.set_type(enemy_type)
+        return enemy
 
     def is_valid_placement(self, x, y):
-        """Check if a tower can be placed at (x, y) by verifying it's within bounds, not on a path, and not too close to other towers."""
-        if not (0 <= x < WINDOW_WIDTH and 0 <= y < WINDOW_HEIGHT):
-            return False
-        # Check if the pixel color matches the path color (approximately)
-        color = self.background.get_at((int(x), int(y)))
-        if all(abs(c - p) < 10 for c, p in zip(color[:3], self.path_color[:3])):
-            return False
-        # Ensure minimum distance from other towers
-        for cell in self.cells:
-            if math.hypot(cell.x - x, cell.y - y) < MIN_TOWER_DISTANCE:
-                return False
-        return True
+        """Check if a tower can be placed at (x, y): within bounds, clear of the path, and not too close to other towers."""
+        return self.placement.is_valid(x, y)
+
+    def add_tower(self, tower):
+        """Add a tower to the map, reserving its spot and refreshing boosts."""
+        self.cells.append(tower)
+        tower.projectile_system = self.projectiles
+        tower.clock = self.clock
+        self.placement.add_tower(tower.x, tower.y)
+        self.auras.mark_dirty()
+        self.cooldowns.schedule(tower, tower.ready_time())
 
     def handle_click(self, pos):
         """Handle mouse click events for selecting towers."""
         mx, my = pos
         for cell in self.cells:
             if math.hypot(cell.x - mx, cell.y - my) < 25:
-                if self.selected_tower == cell:
-                    self.selected_tower = None
-                    cell.menu.visible = False
-                else:
-                    self.selected_tower = cell
-                    cell.menu.visible = True
+                self.selected_tower = None if self.selected_tower == cell else cell
                 for c in self.cells:
                     c.selected = (c == self.selected_tower)
                 return
         self.selected_tower = None
         for cell in self.cells:
-            cell.menu.visible = False
             cell.selected = False
 
     def handle_events(self):
-        """Handle all pygame events, including quitting, mouse clicks, and dragging towers."""
+        """Handle all pygame events, translating mouse input into game actions."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 # Quit the game when the window is closed
                 self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                # Toggle frame profiling and its overlay
+                self.profiler.toggle()
+                self.renderer.invalidate()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                # Export the recorded frame timings
+                self.profiler.export_csv("frame_profile.csv")
+                self.profiler.export_json("frame_profile.json")
+            elif self.replay is not None:
+                # Inputs come from the replay log while one is playing
+                continue
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    pos = pygame.mouse.get_pos()
+                    pos = event.pos
                     if self.pause_button_rect.collidepoint(pos):
                         # Toggle pause when pause button is clicked
-                        self._toggle_pause()
+                        self.perform(InputLog.PAUSE)
                         return
-                    tower_class, cost = self.shop.get_clicked_tower(*pos)
-                    if tower_class and self.resources >= cost:
+                    if self.speed_button_rect.collidepoint(pos):
+                        # Cycle to the next fast-forward speed
+                        next_speed = SPEEDS[(SPEEDS.index(self.speed) + 1) % len(SPEEDS)]
+                        self.perform(InputLog.SPEED, next_speed)
+                        return
+                    slot = self.shop.get_clicked_index(*pos)
+                    if slot is not None and self.resources >= self.shop.towers[slot][2]:
                         # Start dragging a new tower if a shop item is clicked and affordable
-                        self._start_dragging_tower(tower_class, cost, pos)
-                    elif self.selected_tower and self.selected_tower.menu.visible:
+                        self.perform(InputLog.BUY, slot, *pos)
+                    elif self.selected_tower:
                         # Handle clicks on the selected tower's menu
-                        self._handle_menu_click(pos)
+                        clicked = self.selected_tower.menu.get_clicked(self.selected_tower, *pos)
+                        if clicked == "Upgrade":
+                            self.perform(InputLog.UPGRADE, 0, *pos)
+                        elif clicked == "Target":
+                            self.perform(InputLog.TARGET, 0, *pos)
+                        else:
+                            self.perform(InputLog.SELECT, 0, *pos)
                     else:
                         # Select or deselect towers
-                        self.handle_click(pos)
+                        self.perform(InputLog.SELECT, 0, *pos)
                 elif event.button == 3:  # Right click
                     # Cancel dragging a tower
-                    self._cancel_dragging_tower()
+                    self.perform(InputLog.CANCEL)
             elif event.type == pygame.MOUSEBUTTONUP and self.dragging_tower:
                 # Place the dragged tower when the mouse button is released
-                self._place_dragging_tower()
+                self.perform(InputLog.PLACE, 0, *event.pos)
+
+    def perform(self, action, arg=0, x=0, y=0):
+        """Apply one input action, logging it with the current frame when recording."""
+        if self.recorder is not None:
+            self.recorder.record(self.frame, action, arg, x, y)
+        if action == InputLog.PAUSE:
+            self._toggle_pause()
+        elif action == InputLog.BUY:
+            tower_class, _, cost, _, _ = self.shop.towers[arg]
+            self._start_dragging_tower(tower_class, cost, (x, y))
+        elif action == InputLog.PLACE:
+            self._place_dragging_tower((x, y))
+        elif action == InputLog.CANCEL:
+            self._cancel_dragging_tower()
+        elif action == InputLog.UPGRADE:
+            self._upgrade_selected_tower()
+        elif action == InputLog.SELECT:
+            self.handle_click((x, y))
+        elif action == InputLog.SPEED:
+            self.speed = arg
+        elif action == InputLog.TARGET:
+            self._cycle_selected_targeting()
 
     def _toggle_pause(self):
         """Toggle the pause state of the game."""
         self.is_paused = not self.is_paused
         if not self.is_paused and self.current_wave == 0:
             self.generate_wave()
-            self.spawn_timer = pygame.time.get_ticks()
+            self.spawn_timer = self.clock.get_ticks()
 
     def _start_dragging_tower(self, tower_class, cost, pos):
         """Start dragging a new tower from the shop."""
         self.dragging_tower = tower_class(*pos, self.menu_bg, self.upgrade_button)
         self.dragging_tower_cost = cost
 
-    def _handle_menu_click(self, pos):
-        """Handle clicks on the selected tower's menu."""
-        button_clicked = self.selected_tower.menu.get_clicked(*pos)
-        if button_clicked == "Upgrade":
-            upgrade_cost = self.selected_tower.get_upgrade_cost()
-            if upgrade_cost != "MAX" and self.resources >= upgrade_cost:
-                self.resources -= upgrade_cost
-                self.selected_tower.upgrade()
-        else:
-            self.handle_click(pos)
+    def _upgrade_selected_tower(self):
+        """Upgrade the selected tower if it isn't maxed out and is affordable."""
+        if self.selected_tower is None:
+            return
+        upgrade_cost = self.selected_tower.get_upgrade_cost()
+        if upgrade_cost != "MAX" and self.resources >= upgrade_cost:
+            self.resources -= upgrade_cost
+            self.selected_tower.upgrade()
+            self.auras.mark_dirty()
+            # A parked tower watches the grid cells of its old range, so put it back on the clock
+            self.cooldowns.schedule(self.selected_tower, self.selected_tower.ready_time())
+
+    def _cycle_selected_targeting(self):
+        """Switch the selected tower to its next targeting policy."""
+        if self.selected_tower is not None:
+            self.selected_tower.cycle_targeting()
 
     def _cancel_dragging_tower(self):
         """Cancel dragging a tower."""
         self.dragging_tower = None
         self.dragging_tower_cost = 0
 
-    def _place_dragging_tower(self):
-        """Place the dragged tower if the position is valid."""
-        mx, my = pygame.mouse.get_pos()
+    def _place_dragging_tower(self, pos):
+        """Place the dragged tower at pos if the position is valid."""
+        if self.dragging_tower is None:
+            return
+        mx, my = pos
         if self.is_valid_placement(mx, my):
             self.dragging_tower.x, self.dragging_tower.y = mx, my
-            self.cells.append(self.dragging_tower)
+            self.add_tower(self.dragging_tower)
             self.resources -= self.dragging_tower_cost
         self.dragging_tower = None
         self.dragging_tower_cost = 0
 
+    def spawn_enemy(self, enemy, enemy_id=None):
+        """Put an enemy on the map, moving it into the enemy store if one is in use."""
+        if self.enemy_store is not None:
+            enemy = self.enemy_store.add(enemy)
+        self.enemies.add(enemy, enemy_id)
+        self.progress.add(enemy)
+        return enemy
+
     def update_enemies(self):
         """Update enemies, spawn new ones, and manage wave progression."""
         if self.is_paused:
             return
-        current_time = pygame.time.get_ticks()
+        current_time = self.clock.get_ticks()
 
         # Spawn enemies from the wave queue
         if self.wave_enemies:
             if current_time - self.spawn_timer >= self.spawn_delay:
-                self.enemies.append(self.wave_enemies.pop(0))
+                type_code, path_index = self.wave_enemies.pop()
+                self.spawn_enemy(self.create_enemy(ENEMY_TYPES[type_code], path_index))
                 self.spawn_timer = current_time
 
         # Update and remove enemies
-        for enemy in self.enemies[:]:
-            enemy.move()
-            if enemy.health <= 0:
-                self.resources += enemy.money
-                self.enemies.remove(enemy)
-            elif enemy.is_finished:
-                self.lives -= 1
+        if self.enemy_store is not None:
+            removed = self._update_stored_enemies()
+        else:
+            removed = []
+            for enemy in self.enemies:
+                enemy.move()
+                if enemy.health <= 0:
+                    self.resources += enemy.money
+                    removed.append(enemy)
+                elif enemy.is_finished:
+                    self.lives -= 1
+                    removed.append(enemy)
+            for enemy in removed:
                 self.enemies.remove(enemy)
+        if self.enemy_store is not None:
+            self.progress.update(removed, self.enemy_store.remaining)
+            ordered = self.progress.order
+            self.enemy_grid.rebuild(self.enemies, self.enemy_store.positions(ordered), ordered)
+        else:
+            self.progress.update(removed)
+            self.enemy_grid.rebuild(self.enemies, ordered=self.progress.order)
+        # Nothing refers to removed enemies once the index and grid are rebuilt, so they can be reused
+        for enemy in removed:
+            self.enemy_pool.release(getattr(enemy, "template", enemy))
 
         # Check for wave completion and start next wave after cooldown
         if not self.wave_enemies and not self.enemies and self.current_wave > 0:
@@ -241,66 +376,284 @@ class Game:
                 if self.wave_cooldown == 0:
                     self.wave_cooldown = current_time
 
+    def _update_stored_enemies(self):
+        """Advance array-backed enemies in one step and drop and return the ones that died or leaked."""
+        self.enemy_store.step()
+        removed = self.enemy_store.collect_removed()
+        for enemy in removed:
+            if enemy.health <= 0:
+                self.resources += enemy.money
+            else:
+                self.lives -= 1
+            self.enemies.remove(enemy)
+            self.enemy_store.release(enemy)
+        return removed
+
     def update_cells(self):
         """Update all towers, applying boosts and attacks."""
         if self.is_paused:
             return
+        for cell in self.auras.refresh(self.cells):
+            # A boost changed this tower's cooldown or range, so its schedule is stale
+            self.cooldowns.schedule(cell, cell.ready_time())
+        grid = self.enemy_grid
         for cell in self.cells:
-            cell.update(self.enemies, self.is_paused)
-            if isinstance(cell, HelperTCell):
-                cell.revert_boosts()
-                cell.apply_boost(self.cells)
-            cell.attack(self.enemies)
-            if hasattr(cell, 'update_projectiles'):
-                cell.update_projectiles(self.enemies)
-
-    def draw(self):
-        """Draw the game state to the screen."""
-        self.screen.blit(self.background, (0, 0))
-        for enemy in self.enemies:
-            enemy.draw(self.screen)
+            cell.update(grid, self.is_paused)
+        # Idle towers come back once an enemy reaches the grid cells their range covers
+        for cell in self.cooldowns.wake(grid.buckets):
+            self.cooldowns.schedule(cell, cell.ready_time())
+        # Only towers whose cooldown has expired try to attack; one that finds no target is parked
+        now = self.clock.get_ticks()
+        for cell in self.cooldowns.pop_ready(now):
+            cell.attack(grid)
+            ready_time = cell.ready_time()
+            if ready_time > now:
+                self.cooldowns.schedule(cell, ready_time)
+                continue
+            cells = grid.cells_in_range(cell.x, cell.y, cell.range_radius)
+            if any(key in grid.buckets for key in cells):
+                # Enemies are close but out of reach, or the tower is still busy, so retry next step
+                self.cooldowns.schedule(cell, ready_time)
+            else:
+                self.cooldowns.park(cell, cells)
+        for cell in self.cells:
+            if cell.should_rotate:
+                cell.track_target(self.enemy_grid)
+
+    def update_projectiles(self):
+        """Move projectiles and apply their hits."""
+        if self.is_paused:
+            return
+        self.projectiles.update(self.enemies)
+
+    def _render_hud_icons(self):
+        """Composite the heart and resource icons, which never change, into one Surface."""
+        surface = pygame.Surface((300, 100), pygame.SRCALPHA)
+        surface.blit(self.lives_img, (0, 0))
+        surface.blit(self.resources_img, (200, 0))
+        return surface
+
+    def _render_speed_button(self, speed):
+        """Render the fast-forward button showing the current speed."""
+        surface = pygame.Surface(self.speed_button_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(surface, (200, 200, 200), surface.get_rect(), border_radius=10)
+        text = self.shop_font.render(f"{speed}x", True, (0, 0, 0))
+        surface.blit(text, text.get_rect(center=surface.get_rect().center))
+        return surface
+
+    def step(self):
+        """Advance the simulation by one frame, applying any replayed inputs due on it."""
+        if self.replay is not None:
+            for action, arg, x, y in self.replay.due(self.frame):
+                self.perform(action, arg, x, y)
+        profiler = self.profiler
+        with profiler.span("enemies"):
+            self.update_enemies()
+        with profiler.span("cells"):
+            self.update_cells()
+        with profiler.span("projectiles"):
+            self.update_projectiles()
+        self.clock.advance(FRAME_MS)
+        self.frame += 1
+        if self.autosave_path is not None:
+            if self.current_wave > self.autosaved_wave or self.frame % CHECKPOINT_FRAMES == 0:
+                self.autosaved_wave = self.current_wave
+                self.save_snapshot(self.autosave_path)
+
+    def run_headless(self, max_wave=50, max_frames=None):
+        """Simulate until game over or max_wave is cleared.
+
+        Without a replay the game resumes automatically between waves; with one, the run ends once
+        the log is exhausted and the game is left paused.
+        """
+        frames = 0
+        while self.running and self.lives > 0 and self.current_wave <= max_wave:
+            if max_frames is not None and frames >= max_frames:
+                break
+            if self.replay is None:
+                if self.is_paused:
+                    self.perform(InputLog.PAUSE)
+            elif self.replay.finished and self.is_paused:
+                break
+            self.profiler.begin_frame()
+            self.step()
+            self.profiler.end_frame()
+            frames += 1
+        return frames
+
+    def save_recording(self, path):
+        """Write the inputs recorded so far to path."""
+        self.recorder.save(path)
+
+    def save_snapshot(self, path):
+        """Write the full game state to path, or to the localStorage key path in the browser."""
+        data = Snapshot.dumps(self)
+        if EMSCRIPTEN:
+            # The browser's file system goes away with the tab, so saves live in localStorage
+            platform.window.localStorage.setItem(path, base64.b64encode(data).decode("ascii"))
+            return
+        # Write beside the target first so a crash mid-write never leaves a truncated save
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def load_snapshot(self, path):
+        """Restore the game state saved at path; call on a newly constructed game."""
+        if EMSCRIPTEN:
+            data = base64.b64decode(platform.window.localStorage.getItem(path))
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+        Snapshot.loads(self, data)
+        self.autosaved_wave = self.current_wave
+
+    def draw(self, alpha=1.0):
+        """Draw the game state, pushing only the regions that changed to the display.
+
+        Moving things are drawn alpha of the way from their previous step to their current one.
+        """
+        renderer = self.renderer
+        screen = self.screen
+        if self.is_paused or self.speed >= FAST_SPEED:
+            # With a step or more per rendered frame, drawing the latest step is as smooth as interpolating
+            alpha = 1.0
+        renderer.begin()
+        if self.enemy_store is not None:
+            for rect in self.enemy_store.draw(screen, alpha):
+                renderer.add(rect)
+        else:
+            for enemy in self.enemies:
+                renderer.add(enemy.draw(screen, alpha))
         for cell in self.cells:
-            cell.draw(self.screen)
-        if self.selected_tower and self.selected_tower.menu.visible:
-            self.selected_tower.menu.draw(self.screen)
-            self.selected_tower.draw_info_overlay(self.screen)
+            renderer.add(cell.draw(screen))
+        renderer.add(self.projectiles.draw(screen, alpha))
+        if self.selected_tower:
+            renderer.add(self.selected_tower.menu.draw(screen, self.selected_tower))
+            renderer.add(self.selected_tower.draw_info_overlay(screen))
         if self.dragging_tower:
             mx, my = pygame.mouse.get_pos()
             self.dragging_tower.x, self.dragging_tower.y = mx, my
-            self.dragging_tower.draw_range_circle(self.screen)
+            renderer.add(screen.blit(self.placement.get_overlay(), (0, 0)))
+            renderer.add(self.dragging_tower.draw_range_circle(screen))
             if not self.is_valid_placement(mx, my):
-                pygame.draw.circle(self.screen, (255, 0, 0), (mx, my), 25, 2)
-            self.dragging_tower.draw(self.screen)
+                renderer.add(pygame.draw.circle(screen, (255, 0, 0), (mx, my), 25, 2))
+            renderer.add(self.dragging_tower.draw(screen))
         # Draw the shop with the smaller font for item prices
-        self.shop.draw(self.screen, self.shop_font)
-        self.screen.blit(self.lives_img, (400, -10))
-        self.screen.blit(self.pixel_font.render(str(self.lives), True, (255, 255, 255)), (485, 30))
-        self.screen.blit(self.resources_img, (600, -10))
-        self.screen.blit(self.pixel_font.render(str(self.resources), True, (255, 255, 255)), (690, 30))
-        wave_text = self.pixel_font.render(f"Wave: {self.current_wave}", True, (255, 255, 255))
-        self.screen.blit(wave_text, (WINDOW_WIDTH / 2 - 150, 90))
+        renderer.add(self.shop.draw(screen, self.shop_font))
+        renderer.add(screen.blit(self.hud_layer.get(), (400, -10)))
+        renderer.add(screen.blit(AssetManager.render_text(self.pixel_font, str(self.lives)), (485, 30)))
+        renderer.add(screen.blit(AssetManager.render_text(self.pixel_font, str(self.resources)), (690, 30)))
+        wave_text = AssetManager.render_text(self.pixel_font, f"Wave: {self.current_wave}")
+        renderer.add(screen.blit(wave_text, (WINDOW_WIDTH / 2 - 150, 90)))
         button_img = self.pause_button if not self.is_paused else self.play_button
-        self.screen.blit(button_img, (WINDOW_WIDTH - 70, 10))
-        creator_credit = self.credit_font.render("Created by Brennon O'Leary", True, (255, 255, 255))
+        renderer.add(screen.blit(button_img, (WINDOW_WIDTH - 70, 10)))
+        renderer.add(screen.blit(self.speed_layer.get(self.speed), self.speed_button_rect))
+        creator_credit = AssetManager.render_text(self.credit_font, "Created by Brennon O'Leary")
         credit_rect = creator_credit.get_rect(bottomright=(WINDOW_WIDTH - 20, WINDOW_HEIGHT - 10))
-        self.screen.blit(creator_credit, credit_rect)
-        pygame.display.update()
+        renderer.add(screen.blit(creator_credit, credit_rect))
+        renderer.add(self.profiler.draw(screen))
+        renderer.end()
 
     async def run(self):
-        """Run the game loop, handling updates and rendering."""
+        """Run the game loop, stepping the simulation at a fixed rate and rendering in between."""
+        accumulator = 0.0
         while self.running and self.lives > 0:
-            self.clock.tick(FPS)
-            self.handle_events()
-            self.update_enemies()
-            self.update_cells()
-            self.draw()
-            if platform.system() == "Emscripten":
-                await asyncio.sleep(1.0 / FPS)
+            # Fast-forward runs proportionally more steps per rendered frame. Whatever backlog exceeds
+            # the catch-up cap is dropped so a long stall can't snowball
+            elapsed = self.frame_clock.tick() if EMSCRIPTEN else self.frame_clock.tick(RENDER_FPS)
+            accumulator = min(accumulator + elapsed * self.speed, FRAME_MS * MAX_CATCH_UP_STEPS * self.speed)
+            profiler = self.profiler
+            profiler.begin_frame()
+            with profiler.span("events"):
+                self.handle_events()
+            while accumulator >= FRAME_MS and self.running:
+                self.step()
+                accumulator -= FRAME_MS
+            with profiler.span("draw"):
+                self.draw(accumulator / FRAME_MS)
+            profiler.end_frame()
+            if EMSCRIPTEN:
+                # Hand the frame back to the browser, which calls us again on its next repaint
+                await asyncio.sleep(0)
         print("Game Over")
         pygame.quit()
 
-if platform.system() == "Emscripten":
-    asyncio.ensure_future(Game().run())
+def draw_loading_screen(screen, loaded, total, group):
+    """Draw a progress bar for asset preloading."""
+    screen.fill((30, 10, 15))
+    font = AssetManager.get_font(None, 36)
+    text = AssetManager.render_text(font, f"Loading {group}...")
+    screen.blit(text, text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40)))
+    bar = pygame.Rect(0, 0, 400, 24)
+    bar.center = (WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2)
+    pygame.draw.rect(screen, (200, 200, 200), bar, 2)
+    fill = bar.inflate(-6, -6)
+    fill.width = round(fill.width * loaded / total)
+    pygame.draw.rect(screen, (200, 40, 60), fill)
+    pygame.display.flip()
+
+async def boot():
+    """Show a progress screen while assets load in chunks, then start the game.
+
+    The browser gets control back between chunks, so the first frame appears right away
+    instead of after every asset has been decoded.
+    """
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("Tower Defense")
+    draw_loading_screen(screen, 0, 1, "assets")
+    await asyncio.sleep(0)
+    groups = [("background", [(BACKGROUND_PATH, (WINDOW_WIDTH, WINDOW_HEIGHT))])] + AssetManager.ASSET_GROUPS
+    await AssetManager.preload(groups, lambda loaded, total, group: draw_loading_screen(screen, loaded, total, group))
+    game = Game(autosave=BROWSER_SAVE)
+    if platform.window.localStorage.getItem(BROWSER_SAVE) is not None:
+        try:
+            game.load_snapshot(BROWSER_SAVE)
+        except (ValueError, struct.error):
+            # A save from an incompatible build can't be resumed, so start over
+            game = Game(autosave=BROWSER_SAVE)
+    await game.run()
+
+def main():
+    """Parse command-line options and start the game, or a headless simulation run."""
+    parser = argparse.ArgumentParser(description="Immune Defense tower defense game")
+    parser.add_argument("--headless", action="store_true", help="run the simulation without a display")
+    parser.add_argument("--waves", type=int, default=50, help="number of waves to simulate in headless mode")
+    parser.add_argument("--enemy-backend", choices=("objects", "numpy"), default="objects",
+                        help="store enemies as Python objects or in NumPy arrays")
+    parser.add_argument("--seed", type=int, help="seed for wave generation")
+    parser.add_argument("--record", metavar="FILE", help="record every input to FILE")
+    parser.add_argument("--replay", metavar="FILE", help="replay the inputs recorded in FILE")
+    parser.add_argument("--load", metavar="FILE", help="resume from a saved snapshot")
+    parser.add_argument("--autosave", metavar="FILE", help="save a snapshot to FILE every wave and every minute of play")
+    parser.add_argument("--profile", metavar="FILE", help="profile every frame and export timings to FILE (.csv or .json)")
+    args = parser.parse_args()
+    replay = InputReplay.load(args.replay) if args.replay else None
+    game = Game(headless=args.headless, enemy_backend=args.enemy_backend, seed=args.seed,
+                replay=replay, record=bool(args.record), autosave=args.autosave)
+    if args.load:
+        game.load_snapshot(args.load)
+    if args.profile:
+        game.profiler.enabled = True
+    if args.headless:
+        frames = game.run_headless(max_wave=args.waves)
+        print(f"Simulated {frames} frames (seed {game.seed}): wave {game.current_wave}, "
+              f"lives {game.lives}, resources {game.resources}")
+        pygame.quit()
+    else:
+        asyncio.run(game.run())
+    if args.record:
+        game.save_recording(args.record)
+    if args.profile:
+        if args.profile.endswith(".json"):
+            game.profiler.export_json(args.profile)
+        else:
+            game.profiler.export_csv(args.profile)
+
+if EMSCRIPTEN:
+    asyncio.ensure_future(boot())
 else:
     if __name__ == "__main__":
-        asyncio.run(Game().run())
\ No newline at end of file
+        main()
\ No newline at end of file